@@ -11,6 +11,7 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from collections import Counter
 import pandas as pd
 from dataclasses import dataclass
 
@@ -22,6 +23,7 @@ from analytics.scripts.duplicate_detector import DuplicateDetector
 from analytics.scripts.data_analyzer import DataAnalyzer
 from analytics.scripts.visualizer import JobMarketVisualizer
 from utils.data_manager import DataManager
+from config.settings import settings
 
 @dataclass
 class WorkflowConfig:
@@ -47,7 +49,12 @@ class AnalyticsWorkflow:
         
         # Initialize components
         self.data_manager = DataManager()
-        self.duplicate_detector = DuplicateDetector()
+        scraper_settings = settings()
+        self.duplicate_detector = DuplicateDetector({
+            'similarity_cache_path': (
+                str(Path(scraper_settings.DATA_PATH) / '.dup_cache.json') if scraper_settings.BACKUP_ENABLED else None
+            )
+        })
         self.data_analyzer = DataAnalyzer()
         self.visualizer = JobMarketVisualizer()
         
@@ -241,6 +248,17 @@ class AnalyticsWorkflow:
                     self.logger.info(f"Loaded {len(jobs)} jobs from {file_path.name}")
                 except Exception as e:
                     self.logger.warning(f"Failed to load {file_path}: {e}")
+            
+            # JSON Lines batches parse in one vectorized pass per file; keys a
+            # record lacks come back as NaN and are dropped, as in the JSON files
+            for file_path in data_dir.glob("*.jsonl"):
+                try:
+                    jobs = pd.read_json(file_path, lines=True, dtype=False, convert_dates=False)
+                    all_jobs.extend({k: v for k, v in record.items() if v == v}
+                                    for record in jobs.to_dict('records'))
+                    self.logger.info(f"Loaded {len(jobs)} jobs from {file_path.name}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to load {file_path}: {e}")
         
         # Add unique IDs if not present
         for i, job in enumerate(all_jobs):
@@ -358,9 +376,9 @@ class AnalyticsWorkflow:
             if 'insights' in analysis:
                 summary['market_insights'] = [
                     {
-                        'category': insight['category'],
-                        'description': insight['description'],
-                        'confidence': insight['confidence']
+                        'category': insight.category,
+                        'description': insight.description,
+                        'confidence': insight.confidence
                     }
                     for insight in analysis['insights']
                 ]
@@ -445,16 +463,21 @@ class AnalyticsWorkflow:
         
         self.logger.info("Running quick analysis")
         
-        # Quick stats
-        df = pd.DataFrame(jobs_data)
+        # Quick stats in a single pass over the jobs
+        companies, locations, sources = Counter(), Counter(), Counter()
+        for job in jobs_data:
+            for field, counter in (('company', companies), ('location', locations), ('source', sources)):
+                value = job.get(field)
+                if value is not None and value == value:  # Skip missing and NaN
+                    counter[value] += 1
         
         quick_stats = {
-            'total_jobs': len(df),
-            'unique_companies': df['company'].nunique() if 'company' in df.columns else 0,
-            'unique_locations': df['location'].nunique() if 'location' in df.columns else 0,
-            'sources': df['source'].value_counts().to_dict() if 'source' in df.columns else {},
-            'top_companies': df['company'].value_counts().head(10).to_dict() if 'company' in df.columns else {},
-            'top_locations': df['location'].value_counts().head(10).to_dict() if 'location' in df.columns else {},
+            'total_jobs': len(jobs_data),
+            'unique_companies': len(companies),
+            'unique_locations': len(locations),
+            'sources': dict(sources.most_common()),
+            'top_companies': dict(companies.most_common(10)),
+            'top_locations': dict(locations.most_common(10)),
         }
         
         return quick_stats
@@ -541,7 +564,7 @@ class AnalyticsWorkflow:
             if 'insights' in analysis:
                 insights_html = ""
                 for insight in analysis['insights']:
-                    insights_html += f'<div class="insight">{insight["description"]}</div>'
+                    insights_html += f'<div class="insight">{insight.description}</div>'
                 market_insights = insights_html
         
         return html_template.format(
@@ -7,7 +7,7 @@ Provides deep insights, statistics, and market analysis
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
-import json
+import orjson
 import logging
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
@@ -18,6 +18,8 @@ from pathlib import Path
 @dataclass
 class MarketInsight:
     """Represents a market insight"""
+    __slots__ = ('category', 'metric', 'value', 'trend', 'description', 'confidence')
+    
     category: str
     metric: str
     value: Any
@@ -25,6 +27,55 @@ class MarketInsight:
     description: str
     confidence: float
 
+def grouped_salary_stats(keys: pd.Series, salaries: pd.Series) -> pd.DataFrame:
+    """
+    Per-group salary statistics in a few array passes over factorized keys
+    
+    Args:
+        keys: Group label per job
+        salaries: Numeric salary per job (NaN where missing)
+        
+    Returns:
+        DataFrame indexed by sorted group label with mean, median, count, min, max and std
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    values = salaries.to_numpy(dtype=float)
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    n_groups = len(uniques)
+    
+    count = np.bincount(codes, minlength=n_groups)
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    np.minimum.at(minimum, codes, values)
+    np.maximum.at(maximum, codes, values)
+    
+    # Median from group-then-value sorted order
+    sorted_values = values[np.lexsort((values, codes))]
+    starts = np.cumsum(count) - count
+    has_data = count > 0
+    lower = np.where(has_data, starts + (count - 1) // 2, 0)
+    upper = np.where(has_data, starts + count // 2, 0)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(codes, weights=values, minlength=n_groups) / count
+        squared_deviations = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=n_groups)
+        std = np.sqrt(squared_deviations / (count - 1))
+    
+    if len(sorted_values):
+        median = np.where(has_data, (sorted_values[lower] + sorted_values[upper]) / 2, np.nan)
+    else:
+        median = np.full(n_groups, np.nan)
+    
+    return pd.DataFrame({
+        'mean': mean,
+        'median': median,
+        'count': count,
+        'min': np.where(has_data, minimum, np.nan),
+        'max': np.where(has_data, maximum, np.nan),
+        'std': np.where(count > 1, std, np.nan)
+    }, index=pd.Index(uniques, name=keys.name))
+
 class DataAnalyzer:
     """Advanced data analysis engine for job market data"""
     
@@ -107,7 +158,7 @@ class DataAnalyzer:
         
         # Extract and standardize salary information
         if 'salary' in df.columns:
-            df['salary_numeric'] = df['salary'].apply(self._extract_salary_numeric)
+            df['salary_numeric'] = self._extract_salary_numeric(df['salary'])
             df['salary_range'] = df['salary_numeric'].apply(self._categorize_salary)
         
         # Standardize locations
@@ -135,42 +186,25 @@ class DataAnalyzer:
         text = re.sub(r'\s+', ' ', text)
         return text
     
-    def _extract_salary_numeric(self, salary_str: str) -> Optional[float]:
-        """Extract numeric salary from salary string"""
-        if not salary_str or pd.isna(salary_str):
-            return None
-        
-        salary_str = str(salary_str).lower()
+    def _extract_salary_numeric(self, salaries: pd.Series) -> pd.Series:
+        """Extract numeric salaries from salary strings (NaN where none)"""
+        salary_str = salaries.fillna('').astype(str).str.lower()
         
         # Remove currency symbols and common words
-        salary_str = re.sub(r'[rs\.\,rupees]', '', salary_str)
-        salary_str = re.sub(r'(per month|monthly|per year|yearly|annually)', '', salary_str)
+        salary_str = salary_str.str.replace(r'[rs\.\,rupees]', '', regex=True)
+        salary_str = salary_str.str.replace(r'(per month|monthly|per year|yearly|annually)', '', regex=True)
         
-        # Look for numeric patterns
-        numbers = re.findall(r'\d+(?:,\d+)*(?:\.\d+)?', salary_str)
-        if not numbers:
-            return None
+        # First numeric pattern of each string
+        numbers = salary_str.str.extract(r'(\d+(?:,\d+)*(?:\.\d+)?)', expand=False)
+        values = pd.to_numeric(numbers.str.replace(',', '', regex=False), errors='coerce')
         
-        # Convert to float and handle thousands/lakhs
-        try:
-            value = float(numbers[0].replace(',', ''))
-            
-            # Handle k/K (thousands)
-            if 'k' in salary_str and value < 1000:
-                value *= 1000
-            
-            # Handle lakh
-            if 'lakh' in salary_str:
-                value *= 100000
-            
-            # Sanity check
-            if self.config['min_salary_for_analysis'] <= value <= self.config['max_salary_for_analysis']:
-                return value
-        
-        except ValueError:
-            pass
+        # Handle k/K (thousands) and lakh
+        values = values.mask(salary_str.str.contains('k', regex=False) & (values < 1000), values * 1000)
+        values = values.mask(salary_str.str.contains('lakh', regex=False), values * 100000)
         
-        return None
+        # Sanity check
+        in_range = values.between(self.config['min_salary_for_analysis'], self.config['max_salary_for_analysis'])
+        return values.where(in_range).astype(float)
     
     def _categorize_salary(self, salary: Optional[float]) -> str:
         """Categorize salary into ranges"""
@@ -363,12 +397,12 @@ class DataAnalyzer:
         
         # Salary by category
         if 'job_category' in df.columns:
-            category_salaries = df.groupby('job_category')['salary_numeric'].agg(['mean', 'median', 'count']).round(2)
+            category_salaries = grouped_salary_stats(df['job_category'], df['salary_numeric'])[['mean', 'median', 'count']].round(2)
             analysis['salary_by_category'] = category_salaries.to_dict('index')
         
         # Salary by location
         if 'location_standardized' in df.columns:
-            location_salaries = df.groupby('location_standardized')['salary_numeric'].agg(['mean', 'median', 'count']).round(2)
+            location_salaries = grouped_salary_stats(df['location_standardized'], df['salary_numeric'])[['mean', 'median', 'count']].round(2)
             analysis['salary_by_location'] = location_salaries.head(10).to_dict('index')
         
         return analysis
@@ -505,7 +539,7 @@ class DataAnalyzer:
         
         # Salary gaps (categories with wide salary ranges)
         if 'salary_numeric' in df.columns and 'job_category' in df.columns:
-            salary_stats = df.groupby('job_category')['salary_numeric'].agg(['min', 'max', 'std']).dropna()
+            salary_stats = grouped_salary_stats(df['job_category'], df['salary_numeric'])[['min', 'max', 'std']].dropna()
             salary_stats['range'] = salary_stats['max'] - salary_stats['min']
             high_variance = salary_stats.nlargest(5, 'range')
             opportunities['high_salary_variance_categories'] = high_variance.to_dict('index')
@@ -608,9 +642,10 @@ class DataAnalyzer:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_file = f'analytics/reports/market_analysis_{timestamp}.json'
         
-        # Convert MarketInsight objects to dictionaries for JSON serialization
+        # Convert MarketInsight objects to dictionaries for JSON serialization,
+        # leaving the caller's analysis as it was
         if 'insights' in analysis:
-            analysis['insights'] = [
+            analysis = {**analysis, 'insights': [
                 {
                     'category': insight.category,
                     'metric': insight.metric,
@@ -620,13 +655,18 @@ class DataAnalyzer:
                     'confidence': insight.confidence
                 }
                 for insight in analysis['insights']
-            ]
+            ]}
         
         # Ensure directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
+        # orjson encodes numpy values natively; anything else unknown falls back to str
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(
+                analysis,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
         
         return output_file
 
@@ -673,7 +713,7 @@ def main():
     
     print("\n=== Key Insights ===")
     for insight in analysis['insights']:
-        print(f"- {insight['description']} (Confidence: {insight['confidence']:.1f})")
+        print(f"- {insight.description} (Confidence: {insight.confidence:.1f})")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
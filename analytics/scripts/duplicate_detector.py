@@ -8,19 +8,80 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Set, Any
 import re
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import combinations
 import hashlib
 import logging
+import zlib
+import os
+from pathlib import Path
 from dataclasses import dataclass
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import json
 from datetime import datetime
 
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s-]')
+# Common company suffixes, removed in one pass
+COMPANY_SUFFIX_PATTERN = re.compile(
+    r'\b(?:pvt ltd|private limited|ltd|inc|corp|corporation|company|co|limited|llc|plc)\b'
+)
+# Common job-related words that add noise
+NOISE_WORDS = frozenset({'job', 'position', 'role', 'vacancy', 'opportunity', 'career'})
+# (weight key, column) pairs that make up the fuzzy similarity score
+FUZZY_FIELDS = [('title', 'title_clean'), ('company', 'company_normalized'),
+                ('location', 'location_clean'), ('description', 'description_clean')]
+# Below this many pairs, process start-up costs more than it saves
+PARALLEL_SCORING_MIN_PAIRS = 10_000
+# MinHash/LSH parameters: 32 bands of 4 rows catch ~87% of pairs at 0.5 shingle Jaccard
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 32
+MINHASH_PRIME = (1 << 31) - 1
+
+
+# Listings repeat the same strings heavily, so normalization is memoized (bounded)
+@lru_cache(maxsize=65536)
+def _clean_string(text: str) -> str:
+    """Lowercase, collapse whitespace and drop special characters"""
+    text = WHITESPACE_PATTERN.sub(' ', text.lower()).strip()
+    return SPECIAL_CHARS_PATTERN.sub(' ', text)
+
+
+@lru_cache(maxsize=65536)
+def _strip_noise_words(text: str) -> str:
+    """Remove noise words from cleaned text"""
+    return ' '.join(w for w in text.split() if w not in NOISE_WORDS)
+
+
+@lru_cache(maxsize=65536)
+def _strip_company_suffixes(company: str) -> str:
+    """Remove company suffixes from a company name"""
+    return COMPANY_SUFFIX_PATTERN.sub('', company.lower()).strip()
+
+
+def _weighted_fuzzy_similarity(job1: Dict[str, str], job2: Dict[str, str],
+                               weights: Dict[str, float]) -> float:
+    """Weighted string similarity over FUZZY_FIELDS (top-level so worker processes can use it)"""
+    total_similarity = 0
+    total_weight = 0
+    
+    for weight_key, column in FUZZY_FIELDS:
+        if column in job1 and column in job2:
+            total_similarity += fuzz.ratio(job1[column], job2[column]) / 100 * weights[weight_key]
+            total_weight += weights[weight_key]
+    
+    return total_similarity / total_weight if total_weight > 0 else 0
+
+
 @dataclass
 class DuplicateMatch:
     """Represents a duplicate match between two jobs"""
+    __slots__ = ('job1_id', 'job2_id', 'similarity_score', 'match_type', 'reasons', 'confidence')
+    
     job1_id: str
     job2_id: str
     similarity_score: float
@@ -32,8 +93,10 @@ class DuplicateDetector:
     """Advanced duplicate detection system for job listings"""
     
     def __init__(self, config: Dict[str, Any] = None):
-        self.config = config or self._default_config()
+        self.config = {**self._default_config(), **(config or {})}
         self.logger = logging.getLogger(__name__)
+        self._sim_config_hash = self._similarity_config_hash()
+        self._sim_cache = self._load_similarity_cache()
         self.vectorizer = TfidfVectorizer(
             stop_words='english',
             max_features=1000,
@@ -57,8 +120,11 @@ class DuplicateDetector:
                 'salary': 0.05
             },
             'fuzzy_threshold': 0.8,
+            'candidate_threshold': 0.4,
+            'minhash_min_jobs': 50_000,
             'min_confidence': 0.6,
-            'enable_advanced_matching': True
+            'enable_advanced_matching': True,
+            'similarity_cache_path': None
         }
     
     def detect_duplicates(self, jobs_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -119,7 +185,7 @@ class DuplicateDetector:
         df['company_normalized'] = df['company_clean'].apply(self._normalize_company_name)
         
         # Generate fingerprints
-        df['fingerprint'] = df.apply(self._generate_fingerprint, axis=1)
+        df['fingerprint'] = self._generate_fingerprints(df)
         
         return df
     
@@ -128,64 +194,42 @@ class DuplicateDetector:
         if pd.isna(text) or not text:
             return ""
         
-        # Convert to lowercase
-        text = str(text).lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Remove special characters but keep alphanumeric and spaces
-        text = re.sub(r'[^\w\s-]', ' ', text)
-        
-        return text
+        return _clean_string(str(text))
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text for better matching"""
         if not text:
             return ""
         
-        # Remove common job-related words that add noise
-        noise_words = {'job', 'position', 'role', 'vacancy', 'opportunity', 'career'}
-        words = text.split()
-        words = [w for w in words if w not in noise_words]
-        
-        return ' '.join(words)
+        return _strip_noise_words(text)
     
     def _normalize_company_name(self, company: str) -> str:
         """Normalize company names for better matching"""
         if not company:
             return ""
         
-        # Remove common company suffixes
-        suffixes = [
-            'pvt ltd', 'private limited', 'ltd', 'inc', 'corp', 'corporation',
-            'company', 'co', 'limited', 'llc', 'plc'
-        ]
-        
-        normalized = company.lower()
-        for suffix in suffixes:
-            normalized = re.sub(rf'\b{suffix}\b', '', normalized)
-        
-        return normalized.strip()
+        return _strip_company_suffixes(company)
     
-    def _generate_fingerprint(self, row: pd.Series) -> str:
-        """Generate a fingerprint for a job listing"""
+    def _generate_fingerprints(self, df: pd.DataFrame) -> pd.Series:
+        """Generate a compact fingerprint for each job listing"""
         # Combine key fields to create a unique fingerprint
-        fields = [
-            row.get('title_normalized', ''),
-            row.get('company_normalized', ''),
-            row.get('location_clean', '')
-        ]
-        
-        combined = '|'.join(fields)
-        return hashlib.md5(combined.encode()).hexdigest()
+        fields = ['title_normalized', 'company_normalized', 'location_clean']
+        columns = [df[field] if field in df.columns else pd.Series('', index=df.index) for field in fields]
+        combined = columns[0].str.cat(columns[1:], sep='|')
+        
+        # 8-byte digests keep the grouping key small; collisions are negligible at job-board scale
+        return pd.Series(
+            [hashlib.blake2b(text.encode(), digest_size=8).digest() for text in combined],
+            index=df.index
+        )
     
     def _find_exact_duplicates(self, df: pd.DataFrame) -> List[DuplicateMatch]:
         """Find exact duplicates based on fingerprints"""
         duplicates = []
         
-        # Group by fingerprint
-        fingerprint_groups = df.groupby('fingerprint')
+        # Most fingerprints are unique, so only group the ones seen more than once
+        repeated = df[df['fingerprint'].duplicated(keep=False)]
+        fingerprint_groups = repeated.groupby('fingerprint', sort=False)
         
         for fingerprint, group in fingerprint_groups:
             if len(group) > 1:
@@ -208,58 +252,219 @@ class DuplicateDetector:
         """Find fuzzy duplicates using string similarity"""
         duplicates = []
         threshold = self.config['fuzzy_threshold']
-        
-        # Compare all pairs (this can be optimized for large datasets)
-        for i in range(len(df)):
-            for j in range(i + 1, len(df)):
-                similarity = self._calculate_fuzzy_similarity(df.iloc[i], df.iloc[j])
-                
-                if similarity >= threshold:
-                    reasons = self._get_similarity_reasons(df.iloc[i], df.iloc[j])
-                    confidence = min(similarity, 0.95)  # Cap confidence for fuzzy matches
-                    
-                    duplicates.append(DuplicateMatch(
-                        job1_id=df.iloc[i]['id'],
-                        job2_id=df.iloc[j]['id'],
-                        similarity_score=similarity,
-                        match_type='fuzzy',
-                        reasons=reasons,
-                        confidence=confidence
-                    ))
+        jobs = df.to_dict('records')
+        
+        # Jobs with identical scored fields are scored once, through a representative
+        groups = defaultdict(list)
+        for position, job in enumerate(jobs):
+            groups[self._similarity_key(job)].append(position)
+        group_keys = list(groups)
+        representatives = [jobs[groups[key][0]] for key in group_keys]
+        
+        # Repeated content pairs with itself, as long as there is text to match on
+        pairs = [(a, a) for a, key in enumerate(group_keys)
+                 if len(groups[key]) > 1
+                 and (representatives[a]['title_clean'].strip() or representatives[a]['company_normalized'].strip())]
+        
+        # Only score pairs whose character n-gram profiles are already close
+        for a, b in self._find_fuzzy_candidates(df.iloc[[groups[key][0] for key in group_keys]]):
+            # Quit early when length differences alone keep the pair under threshold
+            if self._fuzzy_similarity_bound(representatives[a], representatives[b]) >= threshold:
+                pairs.append((a, b))
+        
+        pair_keys = [tuple(sorted((group_keys[a], group_keys[b]))) for a, b in pairs]
+        
+        # Reuse scores from earlier runs over the same job content
+        pending = [k for k, pair_key in enumerate(pair_keys) if pair_key not in self._sim_cache]
+        scores = {pair_key: self._sim_cache[pair_key] for pair_key in pair_keys if pair_key in self._sim_cache}
+        scores.update(zip(
+            [pair_keys[k] for k in pending],
+            self._score_fuzzy_pairs([(representatives[pairs[k][0]], representatives[pairs[k][1]]) for k in pending])
+        ))
+        
+        for (a, b), pair_key in zip(pairs, pair_keys):
+            similarity = scores[pair_key]
+            if similarity < threshold:
+                continue
+            
+            reasons = self._get_similarity_reasons(representatives[a], representatives[b])
+            confidence = min(similarity, 0.95)  # Cap confidence for fuzzy matches
+            
+            # Expand the representative match to every job pair it stands for
+            if a == b:
+                job_pairs = combinations(groups[group_keys[a]], 2)
+            else:
+                job_pairs = ((min(i, j), max(i, j)) for i in groups[group_keys[a]] for j in groups[group_keys[b]])
+            
+            for i, j in job_pairs:
+                duplicates.append(DuplicateMatch(
+                    job1_id=jobs[i]['id'],
+                    job2_id=jobs[j]['id'],
+                    similarity_score=similarity,
+                    match_type='fuzzy',
+                    reasons=list(reasons),
+                    confidence=confidence
+                ))
+        
+        # Keep only pairs from the current pool so the cache tracks live postings
+        self._sim_cache = scores
+        self._save_similarity_cache()
         
         return duplicates
     
-    def _calculate_fuzzy_similarity(self, job1: pd.Series, job2: pd.Series) -> float:
-        """Calculate fuzzy similarity between two jobs"""
-        weights = self.config['weights']
-        total_similarity = 0
-        total_weight = 0
+    def _score_fuzzy_pairs(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[float]:
+        """Score job pairs, fanning out across processes for large batches"""
+        score = partial(_weighted_fuzzy_similarity, weights=self.config['weights'])
+        
+        if len(pairs) < PARALLEL_SCORING_MIN_PAIRS:
+            return [score(job1, job2) for job1, job2 in pairs]
+        
+        # Ship only the scored fields to the workers
+        columns = [column for _, column in FUZZY_FIELDS]
+        firsts = [{c: job1[c] for c in columns if c in job1} for job1, _ in pairs]
+        seconds = [{c: job2[c] for c in columns if c in job2} for _, job2 in pairs]
+        
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(pairs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(score, firsts, seconds, chunksize=chunksize))
+    
+    def _similarity_key(self, job: Dict[str, Any]) -> str:
+        """Hash of the fields used in fuzzy scoring"""
+        combined = '|'.join(job.get(column, '') for _, column in FUZZY_FIELDS)
+        return hashlib.md5(combined.encode()).hexdigest()
+    
+    def _similarity_config_hash(self) -> str:
+        """Hash of the settings fuzzy scores depend on, so cached scores follow them"""
+        scoring = {'weights': self.config['weights'], 'fields': FUZZY_FIELDS}
+        return hashlib.md5(json.dumps(scoring, sort_keys=True).encode()).hexdigest()
+    
+    def _load_similarity_cache(self) -> Dict[Tuple[str, str], float]:
+        """Load fuzzy similarity scores persisted by a previous run with the same scoring settings"""
+        cache_path = self.config['similarity_cache_path']
+        if not cache_path or not Path(cache_path).exists():
+            return {}
         
-        # Title similarity
-        if 'title_clean' in job1 and 'title_clean' in job2:
-            title_sim = SequenceMatcher(None, job1['title_clean'], job2['title_clean']).ratio()
-            total_similarity += title_sim * weights['title']
-            total_weight += weights['title']
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('config') != self._sim_config_hash:
+                self.logger.info(f"Scoring settings changed, ignoring similarity cache {cache_path}")
+                return {}
+            return {tuple(key.split(':')): float(score) for key, score in data['scores'].items()}
+        except Exception as e:
+            self.logger.warning(f"Failed to load similarity cache {cache_path}: {e}")
+            return {}
+    
+    def _save_similarity_cache(self):
+        """Persist fuzzy similarity scores for the next run"""
+        cache_path = self.config['similarity_cache_path']
+        if not cache_path:
+            return
         
-        # Company similarity
-        if 'company_normalized' in job1 and 'company_normalized' in job2:
-            company_sim = SequenceMatcher(None, job1['company_normalized'], job2['company_normalized']).ratio()
-            total_similarity += company_sim * weights['company']
-            total_weight += weights['company']
+        try:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            # Plain JSON, so loading the cache never runs code from the data directory
+            data = {
+                'config': self._sim_config_hash,
+                'scores': {':'.join(pair_key): score for pair_key, score in self._sim_cache.items()}
+            }
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save similarity cache {cache_path}: {e}")
+    
+    def _find_fuzzy_candidates(self, df: pd.DataFrame) -> List[Tuple[int, int]]:
+        """Find candidate pairs using char n-gram TF-IDF and sparse cosine similarity"""
+        texts = (df['title_clean'] + ' ' + df['company_normalized'] + ' ' + df['location_clean']).tolist()
         
-        # Location similarity
-        if 'location_clean' in job1 and 'location_clean' in job2:
-            location_sim = SequenceMatcher(None, job1['location_clean'], job2['location_clean']).ratio()
-            total_similarity += location_sim * weights['location']
-            total_weight += weights['location']
+        if len(texts) < 2 or not any(text.strip() for text in texts):
+            return []
+        
+        # Pairwise cosine grows quadratically within blocks; LSH stays linear at scale
+        if len(texts) >= self.config.get('minhash_min_jobs', 50_000):
+            return self._find_minhash_candidates(texts)
+        
+        vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 3))
+        try:
+            tfidf_matrix = vectorizer.fit_transform(texts)
+        except ValueError as e:  # Empty vocabulary
+            self.logger.warning(f"Fuzzy candidate generation failed: {e}")
+            return []
+        
+        threshold = self.config.get('candidate_threshold', 0.4)
+        candidates = []
+        
+        # Rows are L2-normalized, so sparse products give all cosine similarities;
+        # multiply in row chunks to keep the dense-ish result bounded
+        chunk_size = max(1, 5_000_000 // tfidf_matrix.shape[0])
+        for start in range(0, tfidf_matrix.shape[0], chunk_size):
+            similarities = (tfidf_matrix[start:start + chunk_size] @ tfidf_matrix.T).tocoo()
+            rows = similarities.row + start
+            mask = (rows < similarities.col) & (similarities.data >= threshold)
+            candidates.extend(zip(rows[mask].tolist(), similarities.col[mask].tolist()))
+        
+        return sorted(candidates)
+    
+    def _find_minhash_candidates(self, texts: List[str]) -> List[Tuple[int, int]]:
+        """Find candidate pairs with MinHash signatures over char 3-grams and LSH banding"""
+        rng = np.random.default_rng(0)
+        a = rng.integers(1, MINHASH_PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+        b = rng.integers(0, MINHASH_PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+        
+        signatures = np.zeros((len(texts), MINHASH_PERMUTATIONS), dtype=np.uint64)
+        hashed_rows = []
+        
+        for row, text in enumerate(texts):
+            text = text.strip()
+            shingles = {text[k:k + 3] for k in range(len(text) - 2)} or ({text} if text else set())
+            if not shingles:
+                continue  # Nothing to match on
+            
+            hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles),
+                                 dtype=np.uint64, count=len(shingles))
+            # Universal hashing (a*x + b) mod p stands in for the permutations
+            signatures[row] = ((np.outer(a, hashes) + b[:, None]) % MINHASH_PRIME).min(axis=1)
+            hashed_rows.append(row)
+        
+        if len(hashed_rows) < 2:
+            return []
+        
+        hashed_rows = np.asarray(hashed_rows)
+        rows_per_band = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        candidates = set()
+        
+        # Jobs whose signatures agree on every row of any band become candidates
+        for band in range(MINHASH_BANDS):
+            band_values = signatures[hashed_rows, band * rows_per_band:(band + 1) * rows_per_band]
+            _, bucket_ids = np.unique(band_values, axis=0, return_inverse=True)
+            bucket_ids = bucket_ids.ravel()
+            
+            order = np.argsort(bucket_ids, kind='stable')
+            boundaries = np.flatnonzero(np.diff(bucket_ids[order])) + 1
+            for bucket in np.split(hashed_rows[order], boundaries):
+                if len(bucket) > 1:
+                    candidates.update(combinations(bucket.tolist(), 2))
+        
+        return sorted(candidates)
+    
+    def _fuzzy_similarity_bound(self, job1: Dict[str, Any], job2: Dict[str, Any]) -> float:
+        """Upper bound of the fuzzy similarity computed from field lengths only"""
+        weights = self.config['weights']
+        total_bound = 0
+        total_weight = 0
         
-        # Description similarity (if available)
-        if 'description_clean' in job1 and 'description_clean' in job2:
-            desc_sim = SequenceMatcher(None, job1['description_clean'], job2['description_clean']).ratio()
-            total_similarity += desc_sim * weights['description']
-            total_weight += weights['description']
+        for weight_key, column in FUZZY_FIELDS:
+            if column in job1 and column in job2:
+                len1, len2 = len(job1[column]), len(job2[column])
+                # Matching characters can never exceed the shorter string
+                bound = 2 * min(len1, len2) / (len1 + len2) if len1 + len2 else 1.0
+                total_bound += bound * weights[weight_key]
+                total_weight += weights[weight_key]
         
-        return total_similarity / total_weight if total_weight > 0 else 0
+        return total_bound / total_weight if total_weight > 0 else 0
     
     def _find_semantic_duplicates(self, df: pd.DataFrame) -> List[DuplicateMatch]:
         """Find semantic duplicates using TF-IDF and cosine similarity"""
@@ -313,57 +518,44 @@ class DuplicateDetector:
         
         # Group by source and compare across sources
         sources = df['source'].unique()
+        threshold = self.config['similarity_thresholds']['high_similarity']
         
         for i, source1 in enumerate(sources):
             for source2 in sources[i + 1:]:
                 df1 = df[df['source'] == source1]
                 df2 = df[df['source'] == source2]
                 
-                # Compare jobs between different sources
-                for _, job1 in df1.iterrows():
-                    for _, job2 in df2.iterrows():
-                        similarity = self._calculate_cross_source_similarity(job1, job2)
-                        
-                        if similarity >= self.config['similarity_thresholds']['high_similarity']:
-                            duplicates.append(DuplicateMatch(
-                                job1_id=job1['id'],
-                                job2_id=job2['id'],
-                                similarity_score=similarity,
-                                match_type='cross_source',
-                                reasons=[f'cross_source_{source1}_{source2}'],
-                                confidence=similarity * 0.9
-                            ))
+                # Score every cross-source pair in one batched C++ call per field
+                title_scores = process.cdist(df1['title_clean'].tolist(), df2['title_clean'].tolist(),
+                                             scorer=fuzz.ratio, dtype=np.float32, workers=-1)
+                company_scores = process.cdist(df1['company_normalized'].tolist(), df2['company_normalized'].tolist(),
+                                               scorer=fuzz.ratio, dtype=np.float32, workers=-1)
+                
+                # For cross-source, focus more on title and company
+                similarities = (title_scores * 0.6 + company_scores * 0.4) / 100
+                ids1 = df1['id'].tolist()
+                ids2 = df2['id'].tolist()
+                
+                for i1, i2 in zip(*np.nonzero(similarities >= threshold)):
+                    similarity = float(similarities[i1, i2])
+                    duplicates.append(DuplicateMatch(
+                        job1_id=ids1[i1],
+                        job2_id=ids2[i2],
+                        similarity_score=similarity,
+                        match_type='cross_source',
+                        reasons=[f'cross_source_{source1}_{source2}'],
+                        confidence=similarity * 0.9
+                    ))
         
         return duplicates
     
-    def _calculate_cross_source_similarity(self, job1: pd.Series, job2: pd.Series) -> float:
-        """Calculate similarity specifically for cross-source comparison"""
-        # For cross-source, focus more on title and company
-        weights = {'title': 0.6, 'company': 0.4}
-        total_similarity = 0
-        total_weight = 0
-        
-        # Title similarity
-        if 'title_clean' in job1 and 'title_clean' in job2:
-            title_sim = SequenceMatcher(None, job1['title_clean'], job2['title_clean']).ratio()
-            total_similarity += title_sim * weights['title']
-            total_weight += weights['title']
-        
-        # Company similarity
-        if 'company_normalized' in job1 and 'company_normalized' in job2:
-            company_sim = SequenceMatcher(None, job1['company_normalized'], job2['company_normalized']).ratio()
-            total_similarity += company_sim * weights['company']
-            total_weight += weights['company']
-        
-        return total_similarity / total_weight if total_weight > 0 else 0
-    
-    def _get_similarity_reasons(self, job1: pd.Series, job2: pd.Series) -> List[str]:
+    def _get_similarity_reasons(self, job1: Dict[str, Any], job2: Dict[str, Any]) -> List[str]:
         """Get specific reasons why two jobs are considered similar"""
         reasons = []
         
         # Check title similarity
         if 'title_clean' in job1 and 'title_clean' in job2:
-            title_sim = SequenceMatcher(None, job1['title_clean'], job2['title_clean']).ratio()
+            title_sim = fuzz.ratio(job1['title_clean'], job2['title_clean']) / 100
             if title_sim > 0.9:
                 reasons.append('very_similar_titles')
             elif title_sim > 0.7:
@@ -371,7 +563,7 @@ class DuplicateDetector:
         
         # Check company similarity
         if 'company_normalized' in job1 and 'company_normalized' in job2:
-            company_sim = SequenceMatcher(None, job1['company_normalized'], job2['company_normalized']).ratio()
+            company_sim = fuzz.ratio(job1['company_normalized'], job2['company_normalized']) / 100
             if company_sim > 0.9:
                 reasons.append('same_company')
             elif company_sim > 0.7:
@@ -379,7 +571,7 @@ class DuplicateDetector:
         
         # Check location similarity
         if 'location_clean' in job1 and 'location_clean' in job2:
-            location_sim = SequenceMatcher(None, job1['location_clean'], job2['location_clean']).ratio()
+            location_sim = fuzz.ratio(job1['location_clean'], job2['location_clean']) / 100
             if location_sim > 0.9:
                 reasons.append('same_location')
         
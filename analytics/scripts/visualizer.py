@@ -6,20 +6,91 @@ Creates charts, graphs, and interactive visualizations for job market analytics
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import plotly.offline as pyo
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union, TYPE_CHECKING
 import json
 import logging
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import base64
 from io import BytesIO
 
+# Plotly is imported inside the chart methods so that importing this module
+# (e.g. for the data helpers) doesn't pay for loading the plotting stack
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Common skills to look for in job titles and descriptions
+SKILLS_LIST = [
+    'python', 'java', 'javascript', 'react', 'nodejs', 'angular', 'vue',
+    'php', 'laravel', 'django', 'flask', 'sql', 'mysql', 'postgresql',
+    'mongodb', 'html', 'css', 'bootstrap', 'git', 'docker', 'aws',
+    'azure', 'linux', 'windows', 'excel', 'powerpoint', 'photoshop',
+    'accounting', 'marketing', 'sales', 'management', 'leadership'
+]
+
+# Longest skills first so e.g. 'javascript' wins over 'java' in the alternation
+SKILLS_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(SKILLS_LIST, key=len, reverse=True)) + r')\b'
+)
+
+# Job categories in priority order, each with one compiled keyword alternation
+CATEGORY_KEYWORDS = {
+    'Technology': ['developer', 'engineer', 'programmer', 'software', 'tech', 'python', 'java'],
+    'Management': ['manager', 'director', 'head', 'lead', 'supervisor'],
+    'Sales & Marketing': ['sales', 'marketing', 'business development', 'account'],
+    'Finance': ['accountant', 'finance', 'banking', 'investment'],
+    'Healthcare': ['doctor', 'nurse', 'medical', 'health'],
+    'Education': ['teacher', 'instructor', 'professor', 'education'],
+    'Customer Service': ['customer service', 'support', 'representative'],
+    'Operations': ['operations', 'logistics', 'supply chain'],
+    'Design': ['designer', 'creative', 'graphic', 'ui', 'ux']
+}
+CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with Largest-Triangle-Three-Buckets downsampling
+    
+    Args:
+        x: Numeric x values, sorted ascending
+        y: Numeric y values
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted indices of the points to keep
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    bucket_size = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        
+        # Average of the next bucket is the third corner of the triangle
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                       (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
+
 class JobMarketVisualizer:
     """Advanced visualization system for job market data"""
     
@@ -27,12 +98,20 @@ class JobMarketVisualizer:
         self.config = config or self._default_config()
         self.logger = logging.getLogger(__name__)
         
-        # Set style preferences
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
         # Ensure output directory exists
-        Path(self.config['output_dir']).mkdir(parents=True, exist_ok=True)
+        self._out_dir = Path(self.config['output_dir'])
+        self._out_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Shared timestamp for all files of one dashboard run
+        self._run_ts = None
+        
+        # Load plotly.js once from the CDN instead of embedding ~3.5 MB per file,
+        # and skip re-validating figures that were built from valid traces
+        self._html_kwargs = {
+            'include_plotlyjs': self.config.get('plotlyjs', 'cdn'),
+            'full_html': True,
+            'validate': False
+        }
         
     def _default_config(self) -> Dict[str, Any]:
         """Default configuration for visualizations"""
@@ -43,17 +122,20 @@ class JobMarketVisualizer:
             'color_palette': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'],
             'font_size': 12,
             'title_font_size': 16,
-            'export_formats': ['png', 'html'],
-            'interactive_plots': True
+            'export_formats': ['html'],  # add 'png' for static images (needs kaleido)
+            'interactive_plots': True,
+            'plotlyjs': 'cdn',
+            'max_trace_points': 2000
         }
     
-    def create_comprehensive_dashboard(self, jobs_data: List[Dict[str, Any]], 
+    def create_comprehensive_dashboard(self, jobs_data: Union[List[Dict[str, Any]], Dict[str, Any]], 
                                      analysis_results: Dict[str, Any] = None) -> Dict[str, str]:
         """
         Create a comprehensive dashboard with all visualizations
         
         Args:
-            jobs_data: List of job dictionaries
+            jobs_data: List of job dictionaries, or preferably a columnar dict
+                mapping field names to equal-length lists/arrays
             analysis_results: Pre-computed analysis results
             
         Returns:
@@ -61,9 +143,26 @@ class JobMarketVisualizer:
         """
         self.logger.info("Creating comprehensive job market dashboard")
         
-        df = pd.DataFrame(jobs_data)
+        self._run_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if isinstance(jobs_data, dict):
+            # Columnar input maps straight onto DataFrame columns
+            df = pd.DataFrame(jobs_data)
+        else:
+            df = pd.DataFrame.from_records(jobs_data)
         created_files = {}
         
+        # Low-cardinality columns hash and group much faster as categoricals
+        for column in ('source', 'company', 'location'):
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        
+        # Parse dates once so the individual charts don't re-parse them
+        if 'scraped_date' in df.columns:
+            df['scraped_date'] = self._parse_dates(df['scraped_date'])
+        
+        # Shared counts are computed once here and reused by every chart
+        analysis_results = {**(analysis_results or {}), **self._precompute_stats(df)}
+        
         # Create individual visualizations
         visualizations = [
             ('overview_stats', self.create_overview_dashboard),
@@ -76,24 +175,89 @@ class JobMarketVisualizer:
             ('trends_analysis', self.create_trends_analysis)
         ]
         
-        for viz_name, viz_function in visualizations:
-            try:
-                files = viz_function(df, analysis_results)
-                created_files[viz_name] = files
-                self.logger.info(f"Created {viz_name} visualization")
-            except Exception as e:
-                self.logger.error(f"Failed to create {viz_name}: {e}")
+        # Charts are independent of each other, so build and write them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(visualizations) + 1)) as executor:
+            # The combined dashboard only reads the shared inputs, so it overlaps the rest
+            combined_future = executor.submit(self.create_combined_dashboard, df, analysis_results)
+            futures = {
+                executor.submit(viz_function, df, analysis_results): viz_name
+                for viz_name, viz_function in visualizations
+            }
+            
+            for future in as_completed(futures):
+                viz_name = futures[future]
+                try:
+                    created_files[viz_name] = future.result()
+                    self.logger.info(f"Created {viz_name} visualization")
+                except Exception as e:
+                    self.logger.error(f"Failed to create {viz_name}: {e}")
+            
+            # Create combined dashboard
+            created_files['combined_dashboard'] = combined_future.result()
         
-        # Create combined dashboard
-        combined_dashboard = self.create_combined_dashboard(df, analysis_results)
-        created_files['combined_dashboard'] = combined_dashboard
+        self._run_ts = None
         
         self.logger.info(f"Dashboard creation completed. Created {len(created_files)} visualizations")
         return created_files
     
+    def _precompute_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Compute the counts and extracted data shared by several charts"""
+        precomputed = {}
+        
+        for column in ('source', 'company', 'location'):
+            if column in df.columns:
+                precomputed[f'{column}_counts'] = df[column].value_counts()
+        
+        if 'title' in df.columns:
+            precomputed['categories'] = pd.Series(self._extract_job_categories(df['title'])).value_counts()
+        
+        precomputed['salary_data'] = self._extract_salary_data(df)
+        precomputed['skills'] = self._extract_skills_data(df)
+        
+        return precomputed
+    
+    def _get_precomputed(self, analysis: Optional[Dict[str, Any]], key: str, compute) -> Any:
+        """Return a precomputed value from the analysis, computing it if missing"""
+        if analysis and analysis.get(key) is not None:
+            return analysis[key]
+        return compute()
+    
+    def _parse_dates(self, dates: pd.Series) -> pd.Series:
+        """Parse scraped dates unless they already are datetimes"""
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return dates
+        return pd.to_datetime(dates, errors='coerce', format='%Y-%m-%d', cache=True)
+    
+    def _downsample_series(self, series: pd.Series) -> pd.Series:
+        """Cap a date-indexed series at max_trace_points while keeping its shape"""
+        max_points = self.config.get('max_trace_points', 2000)
+        if len(series) <= max_points:
+            return series
+        
+        x = pd.to_datetime(series.index).to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+        y = series.to_numpy(dtype=float)
+        return series.iloc[lttb_indices(x, y, max_points)]
+    
+    def _save_html(self, fig: 'go.Figure', name: str) -> str:
+        """Render a figure to HTML in memory and write it in a single atomic step"""
+        html_file = self._output_file(name, 'html')
+        tmp_file = f"{html_file}.tmp"
+        
+        Path(tmp_file).write_text(fig.to_html(**self._html_kwargs), encoding='utf-8')
+        os.replace(tmp_file, html_file)
+        
+        return html_file
+    
+    def _output_file(self, name: str, extension: str) -> str:
+        """Build an output file path stamped with the current run timestamp"""
+        timestamp = self._run_ts or datetime.now().strftime('%Y%m%d_%H%M%S')
+        return str(self._out_dir / f"{name}_{timestamp}.{extension}")
+    
     def create_overview_dashboard(self, df: pd.DataFrame, 
                                 analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create overview statistics dashboard"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         # Create subplots
         fig = make_subplots(
@@ -106,7 +270,8 @@ class JobMarketVisualizer:
         
         # Source distribution
         if 'source' in df.columns:
-            source_counts = df['source'].value_counts()
+            source_counts = self._get_precomputed(analysis, 'source_counts',
+                                                  lambda: df['source'].value_counts())
             fig.add_trace(
                 go.Pie(labels=source_counts.index, values=source_counts.values,
                       name="Sources"),
@@ -115,7 +280,8 @@ class JobMarketVisualizer:
         
         # Top companies
         if 'company' in df.columns:
-            company_counts = df['company'].value_counts().head(10)
+            company_counts = self._get_precomputed(analysis, 'company_counts',
+                                                   lambda: df['company'].value_counts()).head(10)
             fig.add_trace(
                 go.Bar(x=company_counts.values, y=company_counts.index,
                       orientation='h', name="Companies"),
@@ -124,7 +290,8 @@ class JobMarketVisualizer:
         
         # Location distribution
         if 'location' in df.columns:
-            location_counts = df['location'].value_counts().head(10)
+            location_counts = self._get_precomputed(analysis, 'location_counts',
+                                                    lambda: df['location'].value_counts()).head(10)
             fig.add_trace(
                 go.Bar(x=location_counts.index, y=location_counts.values,
                       name="Locations"),
@@ -133,8 +300,10 @@ class JobMarketVisualizer:
         
         # Job categories (if we can derive them)
         if 'title' in df.columns:
-            categories = self._extract_job_categories(df['title'])
-            category_counts = pd.Series(categories).value_counts()
+            category_counts = self._get_precomputed(
+                analysis, 'categories',
+                lambda: pd.Series(self._extract_job_categories(df['title'])).value_counts()
+            )
             fig.add_trace(
                 go.Pie(labels=category_counts.index, values=category_counts.values,
                       name="Categories"),
@@ -148,21 +317,21 @@ class JobMarketVisualizer:
         )
         
         # Save the plot
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/overview_dashboard_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'overview_dashboard')
         
         return {'html': html_file}
     
     def create_company_analysis(self, df: pd.DataFrame, 
                               analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create company hiring analysis visualization"""
+        import plotly.graph_objects as go
         
         if 'company' not in df.columns:
             return {}
         
         # Top hiring companies
-        company_counts = df['company'].value_counts().head(20)
+        company_counts = self._get_precomputed(analysis, 'company_counts',
+                                               lambda: df['company'].value_counts()).head(20)
         
         # Create interactive bar chart
         fig = go.Figure(data=[
@@ -180,34 +349,32 @@ class JobMarketVisualizer:
         )
         
         # Save the plot
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/company_analysis_{timestamp}.html"
-        fig.write_html(html_file)
-        
-        # Also create static version
-        plt.figure(figsize=self.config['figure_size'])
-        plt.bar(range(len(company_counts)), company_counts.values)
-        plt.xticks(range(len(company_counts)), company_counts.index, rotation=45, ha='right')
-        plt.title('Top Hiring Companies in Nepal')
-        plt.xlabel('Company')
-        plt.ylabel('Number of Job Openings')
-        plt.tight_layout()
-        
-        png_file = f"{self.config['output_dir']}/company_analysis_{timestamp}.png"
-        plt.savefig(png_file, dpi=self.config['dpi'], bbox_inches='tight')
-        plt.close()
-        
-        return {'html': html_file, 'png': png_file}
+        html_file = self._save_html(fig, 'company_analysis')
+        created = {'html': html_file}
+        
+        # Also create static version from the same figure (requires kaleido);
+        # the HTML chart is still returned if the image export fails
+        if 'png' in self.config.get('export_formats', []):
+            png_file = self._output_file('company_analysis', 'png')
+            try:
+                fig.write_image(png_file, width=1200, height=800, scale=2)
+                created['png'] = png_file
+            except Exception as e:
+                self.logger.warning(f"Could not export company_analysis PNG: {e}")
+        
+        return created
     
     def create_location_heatmap(self, df: pd.DataFrame, 
                               analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create location-based job distribution heatmap"""
+        import plotly.graph_objects as go
         
         if 'location' not in df.columns:
             return {}
         
         # Process location data
-        location_counts = df['location'].value_counts().head(15)
+        location_counts = self._get_precomputed(analysis, 'location_counts',
+                                                lambda: df['location'].value_counts()).head(15)
         
         # Create heatmap-style visualization
         fig = go.Figure(data=go.Bar(
@@ -228,18 +395,19 @@ class JobMarketVisualizer:
             height=600
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/location_heatmap_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'location_heatmap')
         
         return {'html': html_file}
     
     def create_salary_analysis(self, df: pd.DataFrame, 
                              analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create salary analysis visualizations"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         # Extract salary information
-        salary_data = self._extract_salary_data(df)
+        salary_data = self._get_precomputed(analysis, 'salary_data',
+                                            lambda: self._extract_salary_data(df))
         
         if salary_data.empty:
             return {}
@@ -253,28 +421,32 @@ class JobMarketVisualizer:
                    [{"type": "scatter"}, {"type": "bar"}]]
         )
         
-        # Salary distribution histogram
+        salaries = salary_data['salary'].to_numpy()
+        
+        # Salary distribution histogram (binned here so raw values aren't shipped to the browser)
+        counts, edges = np.histogram(salaries, bins=20)
         fig.add_trace(
-            go.Histogram(x=salary_data['salary'], nbinsx=20, name="Salary Distribution"),
+            go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                  name="Salary Distribution"),
             row=1, col=1
         )
         
         # Salary by top companies (box plot)
         if 'company' in df.columns:
-            top_companies = df['company'].value_counts().head(10).index
-            company_salary_data = []
-            for company in top_companies:
-                company_salaries = salary_data[salary_data['company'] == company]['salary']
-                if len(company_salaries) > 0:
-                    fig.add_trace(
-                        go.Box(y=company_salaries, name=company),
-                        row=1, col=2
-                    )
+            top_companies = self._get_precomputed(analysis, 'company_counts',
+                                                  lambda: df['company'].value_counts()).head(10).index
+            top_company_salaries = salary_data[salary_data['company'].isin(top_companies)]
+            for company, group in top_company_salaries.groupby('company', observed=True):
+                fig.add_trace(
+                    go.Box(y=group['salary'].to_numpy(), name=company),
+                    row=1, col=2
+                )
         
         # Salary trends over time (if date available)
         if 'scraped_date' in df.columns:
-            df['scraped_date'] = pd.to_datetime(df['scraped_date'], errors='coerce')
-            daily_avg_salary = salary_data.groupby(salary_data['scraped_date'].dt.date)['salary'].mean()
+            salary_dates = self._parse_dates(salary_data['scraped_date'])
+            daily_avg_salary = salary_data.groupby(salary_dates.dt.floor('D'))['salary'].mean()
+            daily_avg_salary = self._downsample_series(daily_avg_salary)
             fig.add_trace(
                 go.Scatter(x=daily_avg_salary.index, y=daily_avg_salary.values,
                          mode='lines+markers', name="Average Salary"),
@@ -282,10 +454,11 @@ class JobMarketVisualizer:
             )
         
         # Salary ranges
-        salary_ranges = pd.cut(salary_data['salary'], bins=5).value_counts()
+        range_counts, range_edges = np.histogram(salaries, bins=5)
+        range_labels = [f"{int(range_edges[i]):,}-{int(range_edges[i + 1]):,}"
+                        for i in range(len(range_counts))]
         fig.add_trace(
-            go.Bar(x=[str(interval) for interval in salary_ranges.index], 
-                  y=salary_ranges.values, name="Salary Ranges"),
+            go.Bar(x=range_labels, y=range_counts, name="Salary Ranges"),
             row=2, col=2
         )
         
@@ -295,22 +468,23 @@ class JobMarketVisualizer:
             height=800
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/salary_analysis_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'salary_analysis')
         
         return {'html': html_file}
     
     def create_job_category_analysis(self, df: pd.DataFrame, 
                                    analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create job category analysis visualization"""
+        import plotly.graph_objects as go
         
         if 'title' not in df.columns:
             return {}
         
         # Extract job categories
-        categories = self._extract_job_categories(df['title'])
-        category_counts = pd.Series(categories).value_counts()
+        category_counts = self._get_precomputed(
+            analysis, 'categories',
+            lambda: pd.Series(self._extract_job_categories(df['title'])).value_counts()
+        )
         
         # Create donut chart
         fig = go.Figure(data=[go.Pie(
@@ -324,18 +498,19 @@ class JobMarketVisualizer:
             annotations=[dict(text='Job<br>Categories', x=0.5, y=0.5, font_size=20, showarrow=False)]
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/job_categories_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'job_categories')
         
         return {'html': html_file}
     
     def create_skills_demand_chart(self, df: pd.DataFrame, 
                                  analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create skills demand visualization"""
+        import plotly.graph_objects as go
+        import plotly.express as px
         
         # Extract skills from job titles and descriptions
-        skills_data = self._extract_skills_data(df)
+        skills_data = self._get_precomputed(analysis, 'skills',
+                                            lambda: self._extract_skills_data(df))
         
         if not skills_data:
             return {}
@@ -356,28 +531,23 @@ class JobMarketVisualizer:
             xaxis_tickangle=-45
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/skills_demand_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'skills_demand')
         
         return {'html': html_file}
     
     def create_source_comparison(self, df: pd.DataFrame, 
                                analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create job source comparison visualization"""
+        import plotly.graph_objects as go
         
         if 'source' not in df.columns:
             return {}
         
         # Source statistics
-        source_stats = df.groupby('source').agg({
-            'title': 'count',
-            'company': lambda x: x.nunique(),
-            'location': lambda x: x.nunique()
-        }).rename(columns={
-            'title': 'Job Count',
-            'company': 'Unique Companies',
-            'location': 'Unique Locations'
+        source_stats = df.groupby('source', observed=True).agg(**{
+            'Job Count': ('title', 'count'),
+            'Unique Companies': ('company', 'nunique'),
+            'Unique Locations': ('location', 'nunique')
         })
         
         # Create grouped bar chart
@@ -397,20 +567,20 @@ class JobMarketVisualizer:
             barmode='group'
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/source_comparison_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'source_comparison')
         
         return {'html': html_file}
     
     def create_trends_analysis(self, df: pd.DataFrame, 
                              analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create trends analysis visualization"""
+        import plotly.graph_objects as go
         
         # Daily posting trends
         if 'scraped_date' in df.columns:
-            df['scraped_date'] = pd.to_datetime(df['scraped_date'], errors='coerce')
-            daily_jobs = df.groupby(df['scraped_date'].dt.date).size()
+            scraped_dates = self._parse_dates(df['scraped_date'])
+            daily_jobs = df.groupby(scraped_dates.dt.floor('D')).size()
+            daily_jobs = self._downsample_series(daily_jobs)
             
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -426,9 +596,7 @@ class JobMarketVisualizer:
                 yaxis_title='Number of Jobs Posted'
             )
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            html_file = f"{self.config['output_dir']}/trends_analysis_{timestamp}.html"
-            fig.write_html(html_file)
+            html_file = self._save_html(fig, 'trends_analysis')
             
             return {'html': html_file}
         
@@ -437,6 +605,8 @@ class JobMarketVisualizer:
     def create_combined_dashboard(self, df: pd.DataFrame, 
                                 analysis: Dict[str, Any] = None) -> Dict[str, str]:
         """Create a comprehensive combined dashboard"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         # Create a large subplot layout
         fig = make_subplots(
@@ -452,7 +622,8 @@ class JobMarketVisualizer:
         # Add all the plots (simplified versions)
         # Source distribution
         if 'source' in df.columns:
-            source_counts = df['source'].value_counts()
+            source_counts = self._get_precomputed(analysis, 'source_counts',
+                                                  lambda: df['source'].value_counts())
             fig.add_trace(
                 go.Pie(labels=source_counts.index, values=source_counts.values),
                 row=1, col=1
@@ -460,7 +631,8 @@ class JobMarketVisualizer:
         
         # Top companies
         if 'company' in df.columns:
-            company_counts = df['company'].value_counts().head(10)
+            company_counts = self._get_precomputed(analysis, 'company_counts',
+                                                   lambda: df['company'].value_counts()).head(10)
             fig.add_trace(
                 go.Bar(x=company_counts.index, y=company_counts.values),
                 row=1, col=2
@@ -468,12 +640,43 @@ class JobMarketVisualizer:
         
         # Location distribution
         if 'location' in df.columns:
-            location_counts = df['location'].value_counts().head(10)
+            location_counts = self._get_precomputed(analysis, 'location_counts',
+                                                    lambda: df['location'].value_counts()).head(10)
             fig.add_trace(
                 go.Bar(x=location_counts.index, y=location_counts.values),
                 row=1, col=3
             )
         
+        # Job categories
+        if 'title' in df.columns:
+            category_counts = self._get_precomputed(
+                analysis, 'categories',
+                lambda: pd.Series(self._extract_job_categories(df['title'])).value_counts()
+            )
+            fig.add_trace(
+                go.Pie(labels=category_counts.index, values=category_counts.values),
+                row=2, col=1
+            )
+        
+        # Salary distribution
+        salary_data = self._get_precomputed(analysis, 'salary_data',
+                                            lambda: self._extract_salary_data(df))
+        if not salary_data.empty:
+            fig.add_trace(
+                go.Histogram(x=salary_data['salary'], nbinsx=20),
+                row=2, col=2
+            )
+        
+        # Skills demand
+        skills_data = self._get_precomputed(analysis, 'skills',
+                                            lambda: self._extract_skills_data(df))
+        if skills_data:
+            top_skills = list(skills_data.items())[:10]
+            fig.add_trace(
+                go.Bar(x=[skill for skill, _ in top_skills], y=[count for _, count in top_skills]),
+                row=2, col=3
+            )
+        
         # Add more plots...
         
         fig.update_layout(
@@ -482,114 +685,66 @@ class JobMarketVisualizer:
             height=1200
         )
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        html_file = f"{self.config['output_dir']}/combined_dashboard_{timestamp}.html"
-        fig.write_html(html_file)
+        html_file = self._save_html(fig, 'combined_dashboard')
         
         return {'html': html_file}
     
     def _extract_job_categories(self, titles: pd.Series) -> List[str]:
         """Extract job categories from titles"""
-        categories = []
-        
-        category_keywords = {
-            'Technology': ['developer', 'engineer', 'programmer', 'software', 'tech', 'python', 'java'],
-            'Management': ['manager', 'director', 'head', 'lead', 'supervisor'],
-            'Sales & Marketing': ['sales', 'marketing', 'business development', 'account'],
-            'Finance': ['accountant', 'finance', 'banking', 'investment'],
-            'Healthcare': ['doctor', 'nurse', 'medical', 'health'],
-            'Education': ['teacher', 'instructor', 'professor', 'education'],
-            'Customer Service': ['customer service', 'support', 'representative'],
-            'Operations': ['operations', 'logistics', 'supply chain'],
-            'Design': ['designer', 'creative', 'graphic', 'ui', 'ux']
-        }
+        titles_lower = titles.fillna('').astype(str).str.lower()
         
-        for title in titles.fillna(''):
-            title_lower = title.lower()
-            categorized = False
-            
-            for category, keywords in category_keywords.items():
-                if any(keyword in title_lower for keyword in keywords):
-                    categories.append(category)
-                    categorized = True
-                    break
-            
-            if not categorized:
-                categories.append('Other')
+        # Job titles repeat heavily, so classify each distinct title only once
+        unique_titles = pd.Series(titles_lower.unique(), dtype=object)
+        matches = [unique_titles.str.contains(pattern) for pattern in CATEGORY_PATTERNS.values()]
+        
+        # np.select keeps the first matching category, as in CATEGORY_KEYWORDS order
+        categories = np.select(matches, list(CATEGORY_PATTERNS), default='Other')
+        category_by_title = dict(zip(unique_titles, categories.tolist()))
         
-        return categories
+        return [category_by_title[title_lower] for title_lower in titles_lower]
     
     def _extract_salary_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Extract and clean salary data"""
         if 'salary' not in df.columns:
             return pd.DataFrame()
         
-        salary_data = []
+        salary_str = df['salary'].astype(str)
         
-        for idx, row in df.iterrows():
-            salary_str = str(row.get('salary', ''))
-            
-            # Extract numeric salary
-            import re
-            numbers = re.findall(r'\d+(?:,\d+)*', salary_str)
-            
-            if numbers:
-                try:
-                    salary = float(numbers[0].replace(',', ''))
-                    
-                    # Handle k/K notation
-                    if 'k' in salary_str.lower() and salary < 1000:
-                        salary *= 1000
-                    
-                    # Handle lakh notation
-                    if 'lakh' in salary_str.lower():
-                        salary *= 100000
-                    
-                    # Reasonable salary range
-                    if 5000 <= salary <= 500000:
-                        salary_data.append({
-                            'salary': salary,
-                            'company': row.get('company', ''),
-                            'location': row.get('location', ''),
-                            'title': row.get('title', ''),
-                            'scraped_date': row.get('scraped_date', '')
-                        })
-                
-                except ValueError:
-                    continue
-        
-        return pd.DataFrame(salary_data)
+        # First number of every salary string, parsed in one vectorized pass
+        numbers = salary_str.str.extract(r'(\d+(?:,\d+)*)', expand=False)
+        salary = pd.to_numeric(numbers.str.replace(',', '', regex=False), errors='coerce')
+        
+        # Handle k/K and lakh notation
+        salary_lower = salary_str.str.lower()
+        salary = salary.mask(salary_lower.str.contains('k', regex=False) & (salary < 1000), salary * 1000)
+        salary = salary.mask(salary_lower.str.contains('lakh', regex=False), salary * 100000)
+        
+        # Reasonable salary range
+        in_range = salary.between(5000, 500000)
+        if not in_range.any():
+            return pd.DataFrame()
+        
+        salary_data = pd.DataFrame({'salary': salary[in_range]})
+        for column in ['company', 'location', 'title', 'scraped_date']:
+            salary_data[column] = df.loc[in_range, column] if column in df.columns else ''
+        
+        return salary_data.reset_index(drop=True)
     
     def _extract_skills_data(self, df: pd.DataFrame) -> Dict[str, int]:
         """Extract skills data from job titles and descriptions"""
-        from collections import Counter
-        
         skills_counter = Counter()
         
-        # Common skills to look for
-        skills_list = [
-            'python', 'java', 'javascript', 'react', 'nodejs', 'angular', 'vue',
-            'php', 'laravel', 'django', 'flask', 'sql', 'mysql', 'postgresql',
-            'mongodb', 'html', 'css', 'bootstrap', 'git', 'docker', 'aws',
-            'azure', 'linux', 'windows', 'excel', 'powerpoint', 'photoshop',
-            'accounting', 'marketing', 'sales', 'management', 'leadership'
-        ]
+        # Join title and description so each job is lowercased and scanned once
+        empty = pd.Series('', index=df.index, dtype=object)
+        texts = (df.get('title', empty).fillna('').astype(str) + ' ' +
+                 df.get('description', empty).fillna('').astype(str)).str.lower()
+        
+        # Scan each distinct text once and weight its skills by how often it occurs
+        for text, occurrences in texts.value_counts().items():
+            for skill in set(SKILLS_PATTERN.findall(text)):
+                skills_counter[skill] += occurrences
         
-        # Search in titles
-        for title in df.get('title', pd.Series()).fillna(''):
-            title_lower = title.lower()
-            for skill in skills_list:
-                if skill in title_lower:
-                    skills_counter[skill] += 1
-        
-        # Search in descriptions if available
-        for desc in df.get('description', pd.Series()).fillna(''):
-            desc_lower = desc.lower()
-            for skill in skills_list:
-                if skill in desc_lower:
-                    skills_counter[skill] += 1
-        
-        return dict(skills_counter)
+        return dict(skills_counter.most_common())
     
     def generate_report_summary(self, visualizations: Dict[str, Any]) -> str:
         """Generate a summary report of all visualizations"""
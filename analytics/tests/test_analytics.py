@@ -18,9 +18,10 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 from analytics.scripts.duplicate_detector import DuplicateDetector, DuplicateMatch
-from analytics.scripts.data_analyzer import DataAnalyzer, MarketInsight
-from analytics.scripts.visualizer import JobMarketVisualizer
+from analytics.scripts.data_analyzer import DataAnalyzer, MarketInsight, grouped_salary_stats
+from analytics.scripts.visualizer import JobMarketVisualizer, lttb_indices
 from analytics.scripts.analytics_workflow import AnalyticsWorkflow, WorkflowConfig
+from utils.data_manager import DataManager
 
 class TestDuplicateDetector(unittest.TestCase):
     """Test cases for duplicate detection system"""
@@ -105,7 +106,38 @@ class TestDuplicateDetector(unittest.TestCase):
             self.assertIsInstance(duplicate.similarity_score, float)
             self.assertGreaterEqual(duplicate.confidence, 0)
             self.assertLessEqual(duplicate.confidence, 1)
-    
+
+    def test_minhash_candidates(self):
+        """Test MinHash LSH candidate generation"""
+        detector = DuplicateDetector({'minhash_min_jobs': 0})
+        texts = [
+            'software engineer tech', 'software engineer tech',
+            'senior software developer tech', 'marketing manager marketing plus', '', 'ab'
+        ]
+        candidates = detector._find_minhash_candidates(texts)
+
+        # Identical texts always share a bucket; unrelated or empty texts never pair up
+        self.assertIn((0, 1), candidates)
+        self.assertNotIn((0, 3), candidates)
+        self.assertTrue(all(4 not in pair and 5 not in pair for pair in candidates))
+
+    def test_similarity_cache(self):
+        """Test fuzzy score cache persistence and invalidation on new weights"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, 'dup_cache.json')
+            detector = DuplicateDetector({'similarity_cache_path': cache_path})
+            detector.detect_duplicates(self.sample_jobs)
+            self.assertTrue(detector._sim_cache)
+
+            # Same scoring settings reuse the stored scores
+            reloaded = DuplicateDetector({'similarity_cache_path': cache_path})
+            self.assertEqual(reloaded._sim_cache, detector._sim_cache)
+
+            # Different weights make the stored scores stale
+            weights = {**detector.config['weights'], 'title': 0.9}
+            reweighted = DuplicateDetector({'similarity_cache_path': cache_path, 'weights': weights})
+            self.assertEqual(reweighted._sim_cache, {})
+
     def test_remove_duplicates(self):
         """Test duplicate removal functionality"""
         results = self.detector.detect_duplicates(self.sample_jobs)
@@ -128,7 +160,7 @@ class TestDataAnalyzer(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.analyzer = DataAnalyzer()
-        self.sample_jobs = [
+        base_jobs = [
             {
                 'id': '1',
                 'title': 'Senior Software Engineer',
@@ -156,7 +188,9 @@ class TestDataAnalyzer(unittest.TestCase):
                 'source': 'froxjob',
                 'scraped_date': '2024-01-16'
             }
-        ] * 20  # Multiply to have more data points
+        ]
+        # Multiply to have more data points; copies so a mutated job doesn't change every repeat of it
+        self.sample_jobs = [dict(job) for _ in range(20) for job in base_jobs]
     
     def test_analyze_market(self):
         """Test market analysis functionality"""
@@ -205,6 +239,21 @@ class TestDataAnalyzer(unittest.TestCase):
             self.assertGreaterEqual(stats['min'], 0)
             self.assertGreaterEqual(stats['max'], stats['min'])
     
+    def test_grouped_salary_stats(self):
+        """Test grouped salary statistics match pandas groupby"""
+        import numpy as np
+        import pandas as pd
+        
+        df = pd.DataFrame({
+            'job_category': ['tech', 'tech', 'tech', 'sales', 'sales', 'hr', None],
+            'salary_numeric': [50000, 70000, np.nan, 30000, 45000, np.nan, 90000]
+        })
+        
+        stats = grouped_salary_stats(df['job_category'], df['salary_numeric'])
+        expected = df.groupby('job_category')['salary_numeric'].agg(['mean', 'median', 'count', 'min', 'max', 'std'])
+        
+        pd.testing.assert_frame_equal(stats, expected, check_dtype=False)
+    
     def test_insights_generation(self):
         """Test market insights generation"""
         analysis = self.analyzer.analyze_market(self.sample_jobs)
@@ -216,10 +265,11 @@ class TestDataAnalyzer(unittest.TestCase):
         # If insights exist, check structure
         if insights:
             insight = insights[0]
-            self.assertIsInstance(insight, dict)
-            self.assertIn('category', insight)
-            self.assertIn('description', insight)
-            self.assertIn('confidence', insight)
+            self.assertIsInstance(insight, MarketInsight)
+            self.assertIsInstance(insight.category, str)
+            self.assertIsInstance(insight.description, str)
+            self.assertGreaterEqual(insight.confidence, 0)
+            self.assertLessEqual(insight.confidence, 1)
     
     def test_export_analysis(self):
         """Test analysis export functionality"""
@@ -311,6 +361,25 @@ class TestJobMarketVisualizer(unittest.TestCase):
         valid_categories = ['Technology', 'Management', 'Sales & Marketing', 'Other']
         for category in categories:
             self.assertIn(category, valid_categories)
+    
+    def test_lttb_indices(self):
+        """Test time-series downsampling keeps endpoints and peaks"""
+        import numpy as np
+        
+        x = np.arange(1000, dtype=float)
+        y = np.sin(x / 50)
+        y[500] = 10  # Spike that must survive downsampling
+        
+        indices = lttb_indices(x, y, 100)
+        
+        self.assertEqual(len(indices), 100)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 999)
+        self.assertIn(500, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        
+        # Short series are returned unchanged
+        self.assertEqual(len(lttb_indices(x[:50], y[:50], 100)), 50)
 
 class TestAnalyticsWorkflow(unittest.TestCase):
     """Test cases for analytics workflow orchestrator"""
@@ -351,6 +420,33 @@ class TestAnalyticsWorkflow(unittest.TestCase):
         data = self.workflow._load_data()
         self.assertIsInstance(data, list)
     
+    def test_load_data_jsonl_uneven_keys(self):
+        """Test JSON Lines records missing keys load without NaN placeholders"""
+        raw_dir = Path(self.temp_dir.name) / 'data' / 'raw'
+        raw_dir.mkdir(parents=True)
+        with open(raw_dir / 'batch.jsonl', 'w') as f:
+            f.write(json.dumps({'id': 'a1', 'title': 'Engineer', 'company': 'TechCorp',
+                                'url': 'https://example.com/1'}) + '\n')
+            f.write(json.dumps({'title': 'Engineer', 'company': 'TechCorp',
+                                'location': 'KTM'}) + '\n')
+        
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            data = self.workflow._load_data(force_reload=True)
+        finally:
+            os.chdir(cwd)
+        
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]['id'], 'a1')
+        self.assertEqual(data[1]['id'], 'job_000001')
+        self.assertNotIn('location', data[0])
+        self.assertNotIn('url', data[1])
+        
+        # Backfilled string ids keep duplicate consolidation working
+        duplicates = DuplicateDetector().detect_duplicates(data)
+        self.assertEqual(len(duplicates['consolidated_duplicates']), 1)
+    
     def test_quick_analysis(self):
         """Test quick analysis functionality"""
         # Create sample data
@@ -368,12 +464,38 @@ class TestAnalyticsWorkflow(unittest.TestCase):
         
         self.assertEqual(quick_stats['total_jobs'], 2)
 
+class TestDataManager(unittest.TestCase):
+    """Test cases for raw data storage and cleanup"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_manager = DataManager(self.temp_dir.name)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def test_clean_duplicates_requires_company(self):
+        """Test title-only matches are kept when the company is missing"""
+        self.data_manager.save_batch([
+            {'title': 'Accountant', 'url': 'https://example.com/jobs/1'},
+            {'title': 'Accountant', 'company': '', 'url': 'https://example.com/jobs/2'},
+            {'title': 'Accountant', 'company': None, 'url': 'https://example.com/jobs/3'},
+            {'title': 'Software Engineer', 'company': 'TechCorp', 'url': 'https://example.com/jobs/4'},
+            {'title': 'software engineer.', 'company': 'TechCorp', 'url': 'https://example.com/jobs/5'},
+        ], 'test')
+        
+        # Only the TechCorp posting repeats; the Accountant postings differ by URL
+        self.assertEqual(self.data_manager.clean_duplicates(), 1)
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for the entire analytics system"""
     
     def setUp(self):
         """Set up integration test fixtures"""
-        self.sample_jobs = [
+        base_jobs = [
             {
                 'id': '1',
                 'title': 'Senior Software Engineer',
@@ -404,7 +526,9 @@ class TestIntegration(unittest.TestCase):
                 'description': 'Digital marketing, SEO',
                 'scraped_date': '2024-01-16'
             }
-        ] * 10  # Multiply for more realistic data size
+        ]
+        # Multiply for more realistic data size; copies so a mutated job doesn't change every repeat of it
+        self.sample_jobs = [dict(job) for _ in range(10) for job in base_jobs]
     
     def test_full_analytics_pipeline(self):
         """Test the complete analytics pipeline"""
@@ -4,35 +4,57 @@ Configuration settings for Nepal Job Scraper.
 Contains default settings, website configurations, and scraping parameters.
 """
 
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, Any
-from pydantic_settings import BaseSettings
+import soupsieve as sv
+from dotenv import dotenv_values
 
+ENV_FILE = ".env"
+ENV_PREFIX = "SCRAPER_"
 
-class ScraperSettings(BaseSettings):
-    """Main configuration for the job scraper."""
-    
-    # General settings
-    DEFAULT_DELAY: float = 1.0
-    MAX_RETRIES: int = 3
-    CONCURRENT_REQUESTS: int = 5
-    
-    # Data settings
-    DATA_PATH: str = "data"
-    BACKUP_ENABLED: bool = True
-    EXPORT_FORMATS: list = ["json", "csv"]
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    return value.strip().lower() in ("1", "true", "t", "yes", "y", "on")
+
+
+@lru_cache(maxsize=None)
+def settings() -> SimpleNamespace:
+    """
+    Main configuration for the job scraper.
     
-    # Logging settings
-    LOG_LEVEL: str = "INFO"
-    LOG_RETENTION_DAYS: int = 30
+    Built once per process from SCRAPER_* environment variables, then the
+    .env file, then the defaults below.
+    """
+    env = {**dotenv_values(ENV_FILE), **os.environ}
     
-    # Request settings
-    REQUEST_TIMEOUT: int = 30
-    USER_AGENT_ROTATION: bool = True
-    RESPECT_ROBOTS_TXT: bool = True
+    def get(name: str, default: Any, parse=str) -> Any:
+        value = env.get(ENV_PREFIX + name)
+        return default if value is None else parse(value)
     
-    class Config:
-        env_file = ".env"
-        env_prefix = "SCRAPER_"
+    return SimpleNamespace(
+        # General settings
+        DEFAULT_DELAY=get("DEFAULT_DELAY", 1.0, float),
+        MAX_RETRIES=get("MAX_RETRIES", 3, int),
+        CONCURRENT_REQUESTS=get("CONCURRENT_REQUESTS", 5, int),
+        
+        # Data settings
+        DATA_PATH=get("DATA_PATH", "data"),
+        BACKUP_ENABLED=get("BACKUP_ENABLED", True, _parse_bool),
+        EXPORT_FORMATS=get("EXPORT_FORMATS", ["json", "csv"], json.loads),
+        
+        # Logging settings
+        LOG_LEVEL=get("LOG_LEVEL", "INFO"),
+        LOG_RETENTION_DAYS=get("LOG_RETENTION_DAYS", 30, int),
+        
+        # Request settings
+        REQUEST_TIMEOUT=get("REQUEST_TIMEOUT", 30, int),
+        USER_AGENT_ROTATION=get("USER_AGENT_ROTATION", True, _parse_bool),
+        RESPECT_ROBOTS_TXT=get("RESPECT_ROBOTS_TXT", True, _parse_bool),
+    )
 
 
 # Website configurations
@@ -254,6 +276,16 @@ WEBSITE_CONFIGS: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# Configured site names in a fixed order
+SITE_IDS = tuple(WEBSITE_CONFIGS)
+
+# CSS selectors compiled once at import, read-only per site.
+# Use COMPILED_SELECTORS[site][name].select(soup) / .select_one(soup)
+COMPILED_SELECTORS = MappingProxyType({
+    site: MappingProxyType({name: sv.compile(selector) for name, selector in config["selectors"].items()})
+    for site, config in WEBSITE_CONFIGS.items()
+})
+
 # Common job data fields
 STANDARD_FIELDS = [
     "id",
@@ -6,14 +6,23 @@ Command-line interface for managing job scraping operations,
 testing scripts, and data management.
 """
 
+import os
 import click
-import json
+import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 from utils import DataManager, setup_logger
-from config.settings import WEBSITE_CONFIGS, SCRAPING_PRIORITY
+from config.settings import WEBSITE_CONFIGS, SCRAPING_PRIORITY, SITE_IDS
+
+# Known sites and their listing for error messages, built once at import
+KNOWN_WEBSITES = frozenset(SITE_IDS)
+WEBSITE_LIST = ', '.join(SITE_IDS)
+
+# Page limit rewrite applied by test-script
+TEST_MAX_PAGES_DEFAULT = b"max_pages: Optional[int] = None"
+TEST_MAX_PAGES_LIMITED = b"max_pages: Optional[int] = 2"
 
 
 @click.group()
@@ -43,9 +52,9 @@ def scrape(ctx, website, max_pages, test_mode):
         logger.info("Running in test mode - limited to 2 pages per website")
     
     if website:
-        if website not in WEBSITE_CONFIGS:
+        if website not in KNOWN_WEBSITES:
             logger.error(f"Unknown website: {website}")
-            logger.info(f"Available websites: {', '.join(WEBSITE_CONFIGS.keys())}")
+            logger.info(f"Available websites: {WEBSITE_LIST}")
             return
         
         websites_to_scrape = [website]
@@ -54,12 +63,14 @@ def scrape(ctx, website, max_pages, test_mode):
     
     logger.info(f"Starting scrape for: {', '.join(websites_to_scrape)}")
     
+    existing_scripts = list_scraper_scripts()
+    
     for site in websites_to_scrape:
         logger.info(f"Scraping {site}...")
         
         # Check if script exists
         script_path = Path(f"scripts/{site}_scraper.py")
-        if not script_path.exists():
+        if script_path.name not in existing_scripts:
             logger.warning(f"No script found for {site} at {script_path}")
             logger.info(f"Create the script first with: python scraper_cli.py create-script {site}")
             continue
@@ -75,9 +86,9 @@ def create_script(ctx, website):
     """Create a new scraper script for a website."""
     logger = ctx.obj['logger']
     
-    if website not in WEBSITE_CONFIGS:
+    if website not in KNOWN_WEBSITES:
         logger.error(f"Unknown website: {website}")
-        logger.info(f"Available websites: {', '.join(WEBSITE_CONFIGS.keys())}")
+        logger.info(f"Available websites: {WEBSITE_LIST}")
         return
     
     config = WEBSITE_CONFIGS[website]
@@ -112,14 +123,10 @@ def test_script(ctx, website):
     # Create a test version in test/ folder
     test_path = Path(f"test/test_{website}_scraper.py")
     
-    # Copy script to test folder with modifications for testing
-    script_content = script_path.read_text()
-    test_content = script_content.replace(
-        "max_pages: Optional[int] = None",
-        "max_pages: Optional[int] = 2"
-    )
-    
-    test_path.write_text(test_content, encoding='utf-8')
+    # Copy script to test folder with modifications for testing, line by line
+    with open(script_path, 'rb') as inp, open(test_path, 'wb') as out:
+        for line in inp:
+            out.write(line.replace(TEST_MAX_PAGES_DEFAULT, TEST_MAX_PAGES_LIMITED))
     logger.info(f"Created test script: {test_path}")
     logger.info("Run the test manually to verify functionality")
 
@@ -127,17 +134,24 @@ def test_script(ctx, website):
 @cli.command()
 @click.option('--website', '-w', help='Filter by website')
 @click.option('--format', '-f', type=click.Choice(['json', 'csv']), default='json')
+@click.option('--batch-size', '-b', type=click.IntRange(min=1), default=5000,
+              help='Records written per batch when streaming')
+@click.option('--force-streaming', is_flag=True,
+              help='Stream in batches even if the data is small enough to export in memory')
 @click.pass_context
-def export(ctx, website, format):
+def export(ctx, website, format, batch_size, force_streaming):
     """Export scraped data to specified format."""
     logger = ctx.obj['logger']
     data_manager = DataManager()
     
+    # None lets the data manager pick in-memory or streaming by data size
+    streaming = True if force_streaming else None
+    
     try:
         if format == 'csv':
-            file_path = data_manager.export_to_csv(website)
+            file_path = data_manager.export_to_csv(website, batch_size=batch_size, streaming=streaming)
         else:
-            file_path = data_manager.export_to_json(website)
+            file_path = data_manager.export_to_json(website, batch_size=batch_size, streaming=streaming)
         
         logger.info(f"Data exported to: {file_path}")
         
@@ -175,13 +189,15 @@ def status(ctx):
     
     logger.info("=== Website Scraper Status ===")
     
+    existing_scripts = list_scraper_scripts()
+    
     for website in WEBSITE_CONFIGS:
-        script_path = Path(f"scripts/{website}_scraper.py")
-        status_icon = "✅" if script_path.exists() else "❌"
+        script_exists = f"{website}_scraper.py" in existing_scripts
+        status_icon = "✅" if script_exists else "❌"
         
         config = WEBSITE_CONFIGS[website]
         logger.info(f"{status_icon} {config['name']} ({website})")
-        logger.info(f"    Script: {'exists' if script_path.exists() else 'missing'}")
+        logger.info(f"    Script: {'exists' if script_exists else 'missing'}")
         logger.info(f"    URL: {config['base_url']}")
 
 
@@ -196,9 +212,24 @@ def clean(ctx):
     logger.info(f"Removed {duplicates_removed} duplicate entries")
 
 
+def list_scraper_scripts() -> frozenset:
+    """List the file names in scripts/ with a single directory read."""
+    try:
+        with os.scandir("scripts") as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+
 def generate_scraper_template(website: str, config: dict) -> str:
     """Generate a scraper script template for a website."""
     
+    # Specialize the site's selectors into module-level compiled constants
+    selector_constants = '\n'.join(
+        f"{name.upper()}_SELECTOR = sv.compile({selector!r})"
+        for name, selector in config['selectors'].items()
+    )
+    
     template = f'''"""
 Scraper for {config['name']} ({website})
 
@@ -209,14 +240,37 @@ based on the actual website structure.
 import re
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from utils import BaseScraper
 
+{selector_constants}
+
+
+def extract_job_links(soup: BeautifulSoup, base_url: str) -> List[str]:
+    """Extract absolute job links from a parsed search results page."""
+    job_links = []
+    for element in JOB_LINKS_SELECTOR.select(soup):
+        href = element.get('href')
+        if href:
+            # Convert relative URLs to absolute
+            job_links.append(urljoin(base_url, href))
+    
+    return job_links
+
+
+def parse_job_links(content: bytes, base_url: str) -> List[str]:
+    """Extract absolute job links from a raw search results page."""
+    return extract_job_links(BeautifulSoup(content, 'lxml'), base_url)
+
 
 class {config['name'].replace(' ', '')}Scraper(BaseScraper):
     """Scraper for {config['name']} job website."""
     
+    # Module-level so listing pages can be parsed in worker processes
+    job_links_parser = staticmethod(parse_job_links)
+    
     def __init__(self):
         super().__init__(
             website_name="{website}",
@@ -225,27 +279,17 @@ class {config['name'].replace(' ', '')}Scraper(BaseScraper):
         )
         
         self.search_url = "{config['search_url']}"
-        self.selectors = {json.dumps(config['selectors'], indent=12)}
         
+    def listing_url(self, page: int) -> str:
+        """Get the search results URL for a page."""
+        # Page 1 is the search page itself, which get_total_pages has usually fetched already
+        return self.search_url if page == 1 else f"{{self.search_url}}?page={{page}}"
+    
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from a search results page."""
-        # Construct search URL for the page
-        search_url = f"{{self.search_url}}?page={{page}}"
-        
         try:
-            response = self.make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job links using configured selector
-            job_elements = soup.select(self.selectors['job_links'])
-            
-            job_links = []
-            for element in job_elements:
-                href = element.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    job_url = urljoin(self.base_url, href)
-                    job_links.append(job_url)
+            soup = self.fetch_soup(self.listing_url(page))
+            job_links = extract_job_links(soup, self.base_url)
             
             self.logger.debug(f"Found {{len(job_links)}} jobs on page {{page}}")
             return job_links
@@ -258,39 +302,39 @@ class {config['name'].replace(' ', '')}Scraper(BaseScraper):
         """Scrape detailed information from a job posting."""
         try:
             response = self.make_request(job_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             job_data = {{'url': job_url}}
             
             # Extract job title
-            title_element = soup.select_one(self.selectors['job_title'])
+            title_element = JOB_TITLE_SELECTOR.select_one(soup)
             job_data['title'] = title_element.get_text(strip=True) if title_element else ''
             
             # Extract company name
-            company_element = soup.select_one(self.selectors['company'])
+            company_element = COMPANY_SELECTOR.select_one(soup)
             job_data['company'] = company_element.get_text(strip=True) if company_element else ''
             
             # Extract location
-            location_element = soup.select_one(self.selectors['location'])
+            location_element = LOCATION_SELECTOR.select_one(soup)
             job_data['location'] = location_element.get_text(strip=True) if location_element else ''
             
             # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
+            desc_element = DESCRIPTION_SELECTOR.select_one(soup)
             job_data['description'] = desc_element.get_text(strip=True) if desc_element else ''
             
             # Extract salary (if available)
-            salary_element = soup.select_one(self.selectors['salary'])
+            salary_element = SALARY_SELECTOR.select_one(soup)
             if salary_element:
                 salary_text = salary_element.get_text(strip=True)
                 job_data['salary'] = salary_text
                 # TODO: Parse salary range into min/max values
             
             # Extract deadline
-            deadline_element = soup.select_one(self.selectors['deadline'])
+            deadline_element = DEADLINE_SELECTOR.select_one(soup)
             job_data['deadline'] = deadline_element.get_text(strip=True) if deadline_element else ''
             
             # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
+            posted_element = POSTED_DATE_SELECTOR.select_one(soup)
             job_data['posted_date'] = posted_element.get_text(strip=True) if posted_element else ''
             
             # TODO: Add more fields as needed
@@ -310,11 +354,10 @@ class {config['name'].replace(' ', '')}Scraper(BaseScraper):
     def get_total_pages(self) -> int:
         """Get the total number of pages available."""
         try:
-            response = self.make_request(self.search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(self.search_url)
             
             # Find pagination elements
-            pagination_elements = soup.select(self.selectors['pagination'])
+            pagination_elements = PAGINATION_SELECTOR.select(soup)
             
             if not pagination_elements:
                 return 1
@@ -356,24 +399,32 @@ def update_website_status(website: str, status: str, notes: str):
     if not status_file.exists():
         return
     
-    content = status_file.read_text()
-    
-    # Update the status in the table
-    # This is a simple implementation - could be improved with proper markdown parsing
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        if f"| {website.title()}" in line or f"| {WEBSITE_CONFIGS[website]['name']}" in line:
-            # Replace the status column
-            parts = line.split('|')
-            if len(parts) >= 4:
-                parts[3] = f" {status} "
-                parts[4] = f" {datetime.now().strftime('%Y-%m-%d')} "
-                parts[5] = f" {notes} "
-                lines[i] = '|'.join(parts)
-            break
-    
-    # Write back to file
-    status_file.write_text('\n'.join(lines))
+    # Row prefixes to look for, encoded once so unmatched lines are copied as raw bytes
+    prefixes = (f"| {website.title()}".encode('utf-8'),
+                f"| {WEBSITE_CONFIGS[website]['name']}".encode('utf-8'))
+    updated = False
+    
+    # Stream the table into a temp file beside the original, then swap it in atomically
+    with open(status_file, 'rb') as inp, \
+            tempfile.NamedTemporaryFile('wb', delete=False, dir=status_file.parent) as out:
+        try:
+            for line in inp:
+                if not updated and any(prefix in line for prefix in prefixes):
+                    # Replace the status column
+                    parts = line.decode('utf-8').split('|')
+                    if len(parts) >= 4:
+                        parts[3] = f" {status} "
+                        parts[4] = f" {datetime.now().strftime('%Y-%m-%d')} "
+                        parts[5] = f" {notes} "
+                        line = '|'.join(parts).encode('utf-8')
+                    updated = True
+                out.write(line)
+        except Exception:
+            os.unlink(out.name)
+            raise
+    
+    os.chmod(out.name, status_file.stat().st_mode)
+    os.replace(out.name, status_file)
 
 
 if __name__ == "__main__":
@@ -6,17 +6,43 @@ based on the actual website structure.
 """
 
 import re
-import json
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
+from typing import Dict, List, Any, Optional, Tuple
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from utils import BaseScraper
+from config.settings import COMPILED_SELECTORS
+
+# Detail-page selectors outside the site config, compiled once
+CONTACT_LINK_SELECTOR = sv.compile('a[href^="mailto:"], a[href^="tel:"]')
+APPLY_LINK_SELECTOR = sv.compile('a[href*="apply"], .apply-button, .apply-link')
+REQUIREMENTS_SELECTOR = sv.compile('.requirements, .qualifications, .job-requirements')
+BENEFITS_SELECTOR = sv.compile('.benefits, .job-benefits, .perks')
+EXPERIENCE_SELECTOR = sv.compile('.experience, .experience-level, .job-experience')
+EDUCATION_SELECTOR = sv.compile('.education, .qualification, .job-education')
+JSON_LD_SELECTOR = sv.compile('script[type="application/ld+json"]')
+
+# Every detail-page element of interest, found together in one tree walk
+DETAIL_SELECTORS = {
+    **{name: COMPILED_SELECTORS["froxjob"][name]
+       for name in ('job_title', 'company', 'location', 'description', 'salary', 'deadline', 'posted_date')},
+    'apply_url': APPLY_LINK_SELECTOR,
+    'requirements': REQUIREMENTS_SELECTOR,
+    'benefits': BENEFITS_SELECTOR,
+    'experience': EXPERIENCE_SELECTOR,
+    'education': EDUCATION_SELECTOR,
+}
+DETAIL_UNION_SELECTOR = sv.compile(', '.join(
+    selector.pattern for selector in [*DETAIL_SELECTORS.values(), CONTACT_LINK_SELECTOR, JSON_LD_SELECTOR]
+))
 
 
 class FroxjobScraper(BaseScraper):
     """Scraper for Froxjob job website."""
     
+    concurrent_details = True
+    
     def __init__(self):
         super().__init__(
             website_name="froxjob",
@@ -25,19 +51,7 @@ class FroxjobScraper(BaseScraper):
         )
         
         self.search_url = "https://froxjob.com"
-        self.selectors = {
-            "job_links": ".joblist li a",
-            "company_cards": ".job-wrapper",
-            "company_name": ".media-heading",
-            "pagination": ".pagination",
-            "job_title": "h1, .job-title",
-            "company": ".company-name, .company",
-            "location": ".location, .address",
-            "description": ".description, .content, .job-content",
-            "salary": ".salary, .salary-range",
-            "deadline": ".deadline, .apply-deadline",
-            "posted_date": ".date, .posted-date"
-}
+        self.selectors = COMPILED_SELECTORS["froxjob"]
         
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from Froxjob main page (no pagination)."""
@@ -47,30 +61,27 @@ class FroxjobScraper(BaseScraper):
         
         try:
             response = self.make_request(self.search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job links using configured selector
-            job_elements = soup.select(self.selectors['job_links'])
+            soup = BeautifulSoup(response.content, 'lxml')
             
             job_links = []
             company_data = {}
             
             # Also extract company information for each job
-            company_cards = soup.select(self.selectors['company_cards'])
+            company_cards = self.selectors['company_cards'].select(soup)
             
             for card in company_cards:
                 # Extract company name
-                company_name_element = card.select_one(self.selectors['company_name'])
+                company_name_element = self.selectors['company_name'].select_one(card)
                 company_name = company_name_element.get_text(strip=True) if company_name_element else 'Unknown Company'
                 
                 # Find all job links within this company card
-                job_links_in_card = card.select(self.selectors['job_links'])
+                job_links_in_card = self.selectors['job_links'].select(card)
                 
                 for link in job_links_in_card:
                     href = link.get('href')
                     if href:
                         # Convert relative URLs to absolute
-                        job_url = urljoin(self.base_url, href)
+                        job_url = self.absolute_url(href)
                         job_links.append(job_url)
                         
                         # Store company data for later use
@@ -91,6 +102,16 @@ class FroxjobScraper(BaseScraper):
     
     def scrape_job_details(self, job_url: str) -> Dict[str, Any]:
         """Scrape detailed information from a Froxjob posting."""
+        try:
+            response = self.make_request(job_url)
+        except Exception as e:
+            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
+            return {'url': job_url, 'error': str(e)}
+        
+        return self.parse_job_details(job_url, response.content)
+    
+    def parse_job_details(self, job_url: str, content: bytes) -> Dict[str, Any]:
+        """Parse a fetched Froxjob posting into job data."""
         try:
             # Start with stored company data if available
             job_data = {'url': job_url}
@@ -101,67 +122,70 @@ class FroxjobScraper(BaseScraper):
                 job_data['company'] = stored_data['company_name']
             
             # Get detailed information from job detail page
-            response = self.make_request(job_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
+            elements, json_ld_scripts = self._find_detail_elements(soup)
             
             # Extract or update job title
-            title_element = soup.select_one(self.selectors['job_title'])
+            title_element = elements.get('job_title')
             if title_element:
                 job_data['title'] = title_element.get_text(strip=True)
             
             # Extract or update company name
-            company_element = soup.select_one(self.selectors['company'])
+            company_element = elements.get('company')
             if company_element:
                 job_data['company'] = company_element.get_text(strip=True)
             
             # Extract location
-            location_element = soup.select_one(self.selectors['location'])
+            location_element = elements.get('location')
             job_data['location'] = location_element.get_text(strip=True) if location_element else ''
             
             # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
+            desc_element = elements.get('description')
             job_data['description'] = desc_element.get_text(strip=True) if desc_element else ''
             
             # Extract salary
-            salary_element = soup.select_one(self.selectors['salary'])
+            salary_element = elements.get('salary')
             if salary_element:
                 job_data['salary'] = salary_element.get_text(strip=True)
             else:
                 job_data['salary'] = ''
             
             # Extract deadline
-            deadline_element = soup.select_one(self.selectors['deadline'])
+            deadline_element = elements.get('deadline')
             job_data['deadline'] = deadline_element.get_text(strip=True) if deadline_element else ''
             
             # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
+            posted_element = elements.get('posted_date')
             job_data['posted_date'] = posted_element.get_text(strip=True) if posted_element else ''
             
             # Extract enhanced contact information
-            contact_email_element = soup.select_one('a[href^="mailto:"]')
+            contact_email_element = elements.get('contact_email')
             if contact_email_element:
                 job_data['contact_email'] = contact_email_element.get('href', '').replace('mailto:', '')
             else:
                 job_data['contact_email'] = ''
             
-            contact_phone_element = soup.select_one('a[href^="tel:"]')
+            contact_phone_element = elements.get('contact_phone')
             if contact_phone_element:
                 job_data['contact_phone'] = contact_phone_element.get('href', '').replace('tel:', '')
             else:
                 job_data['contact_phone'] = ''
             
             # Extract apply URL
-            apply_element = soup.select_one('a[href*="apply"], .apply-button, .apply-link')
+            apply_element = elements.get('apply_url')
             if apply_element:
                 job_data['apply_url'] = apply_element.get('href', '')
             else:
                 job_data['apply_url'] = ''
             
             # Try to extract JSON-LD structured data for enhanced information
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
             for script in json_ld_scripts:
+                raw = script.string
+                # Only JobPosting blocks are used; skip decoding anything else
+                if not raw or 'JobPosting' not in raw:
+                    continue
                 try:
-                    data = json.loads(script.string)
+                    data = orjson.loads(str(raw))
                     if isinstance(data, dict) and data.get('@type') == 'JobPosting':
                         # Extract structured job data
                         if data.get('title') and not job_data.get('title'):
@@ -192,28 +216,28 @@ class FroxjobScraper(BaseScraper):
             
             # Try to extract additional details commonly found on job pages
             # Look for requirements, qualifications, etc.
-            requirements_element = soup.select_one('.requirements, .qualifications, .job-requirements')
+            requirements_element = elements.get('requirements')
             if requirements_element and not job_data.get('requirements'):
                 job_data['requirements'] = requirements_element.get_text(strip=True)
             elif not job_data.get('requirements'):
                 job_data['requirements'] = ''
             
             # Look for benefits
-            benefits_element = soup.select_one('.benefits, .job-benefits, .perks')
+            benefits_element = elements.get('benefits')
             if benefits_element and not job_data.get('benefits'):
                 job_data['benefits'] = benefits_element.get_text(strip=True)
             elif not job_data.get('benefits'):
                 job_data['benefits'] = ''
             
             # Extract experience level if available
-            experience_element = soup.select_one('.experience, .experience-level, .job-experience')
+            experience_element = elements.get('experience')
             if experience_element and not job_data.get('experience_required'):
                 job_data['experience_required'] = experience_element.get_text(strip=True)
             elif not job_data.get('experience_required'):
                 job_data['experience_required'] = ''
             
             # Extract education requirements if available
-            education_element = soup.select_one('.education, .qualification, .job-education')
+            education_element = elements.get('education')
             if education_element and not job_data.get('education_required'):
                 job_data['education_required'] = education_element.get_text(strip=True)
             elif not job_data.get('education_required'):
@@ -225,6 +249,35 @@ class FroxjobScraper(BaseScraper):
             self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
             return {'url': job_url, 'error': str(e)}
     
+    def _find_detail_elements(self, soup: BeautifulSoup) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        Find the first element for each detail field and all JSON-LD scripts.
+        
+        A single union-selector pass yields matches in document order, so the
+        first match per field is what select_one would have returned.
+        
+        Args:
+            soup: Parsed job detail page
+            
+        Returns:
+            Tuple of (field name -> element, list of JSON-LD script elements)
+        """
+        elements = {}
+        json_ld_scripts = []
+        
+        for element in DETAIL_UNION_SELECTOR.iselect(soup):
+            if JSON_LD_SELECTOR.match(element):
+                json_ld_scripts.append(element)
+            if CONTACT_LINK_SELECTOR.match(element):
+                # One selector for both link kinds; the href prefix tells them apart
+                field = 'contact_email' if element.get('href', '').startswith('mailto:') else 'contact_phone'
+                elements.setdefault(field, element)
+            for field, selector in DETAIL_SELECTORS.items():
+                if field not in elements and selector.match(element):
+                    elements[field] = element
+        
+        return elements, json_ld_scripts
+    
     def get_total_pages(self) -> int:
         """Get the total number of pages available."""
         # Froxjob shows all jobs on one page, so always return 1
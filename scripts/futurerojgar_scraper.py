@@ -6,16 +6,40 @@ based on the actual website structure.
 """
 
 import re
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from utils import BaseScraper
+from config.settings import COMPILED_SELECTORS
+
+# Selectors not in the site config, compiled once
+CLASSIFIED_LINK_SELECTOR = sv.compile('a[href*="classified"]')
+
+# Builds only elements the pagination selector ([class*='page']) can match
+PAGINATION_STRAINER = SoupStrainer(class_=re.compile('page'))
+
+# job_data key -> detail selector name, in output order
+DETAIL_FIELDS = (
+    ('title', 'job_title'),
+    ('company', 'company'),
+    ('location', 'location'),
+    ('description', 'description'),
+    ('salary', 'salary'),
+    ('deadline', 'deadline'),
+    ('posted_date', 'posted_date'),
+)
+
+# Detail-page fields, located together in one walk of the parsed page
+DETAIL_SELECTORS = {name: COMPILED_SELECTORS["futurerojgar"][name] for _, name in DETAIL_FIELDS}
+DETAIL_UNION_SELECTOR = sv.compile(', '.join(selector.pattern for selector in DETAIL_SELECTORS.values()))
 
 
 class FutureRojgarScraper(BaseScraper):
     """Scraper for FutureRojgar job website."""
     
+    concurrent_details = True
+    
     def __init__(self):
         super().__init__(
             website_name="futurerojgar",
@@ -24,18 +48,7 @@ class FutureRojgarScraper(BaseScraper):
         )
         
         self.search_url = "https://futurerojgar.com"
-        self.selectors = {
-            "job_links": ".job a, a[href*='classified']",
-            "job_containers": ".job",
-            "pagination": "[class*='page']",
-            "job_title": "h1, .title, .job-title",
-            "company": ".company, .company-name, .employer",
-            "location": ".location, .address",
-            "description": ".description, .content, .details",
-            "salary": ".salary, .pay",
-            "deadline": ".deadline, .expiry",
-            "posted_date": ".date, .posted"
-}
+        self.selectors = COMPILED_SELECTORS["futurerojgar"]
         
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from FutureRojgar search results page."""
@@ -46,11 +59,12 @@ class FutureRojgarScraper(BaseScraper):
             search_url = self.search_url
         
         try:
-            response = self.make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(search_url)
             
-            # Find job links using configured selector - focus on classified links
-            job_elements = soup.select('a[href*="classified"]')
+            # Job links are the classified links. The recent-jobs block (.job a,
+            # .job-item a) only ever contributes classified links too, so this
+            # single pass already covers it
+            job_elements = CLASSIFIED_LINK_SELECTOR.select(soup)
             
             job_links = []
             seen_links = set()  # Avoid duplicates
@@ -59,20 +73,9 @@ class FutureRojgarScraper(BaseScraper):
                 href = element.get('href')
                 if href and href not in seen_links:
                     # Convert relative URLs to absolute
-                    job_url = urljoin(self.base_url, href)
-                    job_links.append(job_url)
+                    job_links.append(self.absolute_url(href))
                     seen_links.add(href)
             
-            # Also try to get recent jobs from main page
-            if page == 1:
-                recent_job_links = soup.select('.job a, .job-item a')
-                for element in recent_job_links:
-                    href = element.get('href')
-                    if href and href not in seen_links and 'classified' in href:
-                        job_url = urljoin(self.base_url, href)
-                        job_links.append(job_url)
-                        seen_links.add(href)
-            
             self.logger.debug(f"Found {len(job_links)} jobs on page {page}")
             return job_links
             
@@ -84,40 +87,28 @@ class FutureRojgarScraper(BaseScraper):
         """Scrape detailed information from a job posting."""
         try:
             response = self.make_request(job_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+        except Exception as e:
+            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
+            return {'url': job_url, 'error': str(e)}
+        
+        return self.parse_job_details(job_url, response.content)
+    
+    def parse_job_details(self, job_url: str, content: bytes) -> Dict[str, Any]:
+        """Parse a fetched FutureRojgar posting into job data."""
+        try:
+            soup = BeautifulSoup(content, 'lxml')
+            elements = self.select_fields(soup, DETAIL_SELECTORS, DETAIL_UNION_SELECTOR)
             
             job_data = {'url': job_url}
             
-            # Extract job title
-            title_element = soup.select_one(self.selectors['job_title'])
-            job_data['title'] = title_element.get_text(strip=True) if title_element else ''
-            
-            # Extract company name
-            company_element = soup.select_one(self.selectors['company'])
-            job_data['company'] = company_element.get_text(strip=True) if company_element else ''
-            
-            # Extract location
-            location_element = soup.select_one(self.selectors['location'])
-            job_data['location'] = location_element.get_text(strip=True) if location_element else ''
-            
-            # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
-            job_data['description'] = desc_element.get_text(strip=True) if desc_element else ''
-            
-            # Extract salary (if available)
-            salary_element = soup.select_one(self.selectors['salary'])
-            if salary_element:
-                salary_text = salary_element.get_text(strip=True)
-                job_data['salary'] = salary_text
-                # TODO: Parse salary range into min/max values
-            
-            # Extract deadline
-            deadline_element = soup.select_one(self.selectors['deadline'])
-            job_data['deadline'] = deadline_element.get_text(strip=True) if deadline_element else ''
-            
-            # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
-            job_data['posted_date'] = posted_element.get_text(strip=True) if posted_element else ''
+            # Extract each field's text; salary is only recorded when present
+            # TODO: Parse salary range into min/max values
+            for field, name in DETAIL_FIELDS:
+                element = elements.get(name)
+                if element:
+                    job_data[field] = element.get_text(strip=True)
+                elif field != 'salary':
+                    job_data[field] = ''
             
             # TODO: Add more fields as needed
             # - job_type
@@ -136,19 +127,18 @@ class FutureRojgarScraper(BaseScraper):
     def get_total_pages(self) -> int:
         """Get the total number of pages available."""
         try:
-            # Check search page for pagination
-            search_url = f"{self.search_url}/search"
-            response = self.make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Check search page for pagination; nothing else is read from it,
+            # so only the pagination markup is built into a tree
+            response = self.make_request(f"{self.search_url}/search")
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=PAGINATION_STRAINER)
             
             # Find pagination elements
-            pagination_elements = soup.select(self.selectors['pagination'])
+            pagination_elements = self.selectors['pagination'].select(soup)
             
             if not pagination_elements:
-                # Try main page for pagination info
-                main_response = self.make_request(self.search_url)
-                main_soup = BeautifulSoup(main_response.content, 'html.parser')
-                pagination_elements = main_soup.select(self.selectors['pagination'])
+                # Try main page for pagination info (already parsed for page 1 links)
+                main_soup = self.fetch_soup(self.search_url)
+                pagination_elements = self.selectors['pagination'].select(main_soup)
             
             if not pagination_elements:
                 return 5  # Default to 5 pages to explore more content
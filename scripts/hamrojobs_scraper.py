@@ -6,16 +6,38 @@ based on the actual website structure.
 """
 
 import re
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from utils import BaseScraper
+from config.settings import COMPILED_SELECTORS
+
+# Builds only elements the pagination selector (.pagination) can match
+PAGINATION_STRAINER = SoupStrainer(class_=re.compile('pagination'))
+
+# job_data key -> detail selector name, in output order
+DETAIL_FIELDS = (
+    ('title', 'job_title'),
+    ('company', 'company'),
+    ('location', 'location'),
+    ('description', 'description'),
+    ('salary', 'salary'),
+    ('deadline', 'deadline'),
+    ('posted_date', 'posted_date'),
+)
+
+# Detail-page fields, located together in one walk of the parsed page
+DETAIL_SELECTORS = {name: COMPILED_SELECTORS["hamrojobs"][name] for _, name in DETAIL_FIELDS}
+DETAIL_UNION_SELECTOR = sv.compile(', '.join(selector.pattern for selector in DETAIL_SELECTORS.values()))
 
 
 class HamroJobsScraper(BaseScraper):
     """Scraper for HamroJobs job website."""
     
+    concurrent_details = True
+    listing_workers = 4
+    
     def __init__(self):
         super().__init__(
             website_name="hamrojobs",
@@ -24,18 +46,7 @@ class HamroJobsScraper(BaseScraper):
         )
         
         self.search_url = "https://hamrojobs.com.np"
-        self.selectors = {
-            "job_links": "a[href*='jobpost']",
-            "job_containers": "[class*='job']",
-            "pagination": ".pagination",
-            "job_title": "h1, .job-title, .title",
-            "company": ".company-name, .company",
-            "location": ".location, .address",
-            "description": ".description, .content, .job-description",
-            "salary": ".salary, .pay",
-            "deadline": ".deadline, .expiry",
-            "posted_date": ".date, .posted"
-}
+        self.selectors = COMPILED_SELECTORS["hamrojobs"]
         
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from a search results page."""
@@ -44,17 +55,17 @@ class HamroJobsScraper(BaseScraper):
         
         try:
             response = self.make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find job links using configured selector
-            job_elements = soup.select(self.selectors['job_links'])
+            job_elements = self.selectors['job_links'].select(soup)
             
             job_links = []
             for element in job_elements:
                 href = element.get('href')
                 if href:
                     # Convert relative URLs to absolute
-                    job_url = urljoin(self.base_url, href)
+                    job_url = self.absolute_url(href)
                     job_links.append(job_url)
             
             self.logger.debug(f"Found {len(job_links)} jobs on page {page}")
@@ -68,40 +79,28 @@ class HamroJobsScraper(BaseScraper):
         """Scrape detailed information from a job posting."""
         try:
             response = self.make_request(job_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+        except Exception as e:
+            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
+            return {'url': job_url, 'error': str(e)}
+        
+        return self.parse_job_details(job_url, response.content)
+    
+    def parse_job_details(self, job_url: str, content: bytes) -> Dict[str, Any]:
+        """Parse a fetched HamroJobs posting into job data."""
+        try:
+            soup = BeautifulSoup(content, 'lxml')
+            elements = self.select_fields(soup, DETAIL_SELECTORS, DETAIL_UNION_SELECTOR)
             
             job_data = {'url': job_url}
             
-            # Extract job title
-            title_element = soup.select_one(self.selectors['job_title'])
-            job_data['title'] = title_element.get_text(strip=True) if title_element else ''
-            
-            # Extract company name
-            company_element = soup.select_one(self.selectors['company'])
-            job_data['company'] = company_element.get_text(strip=True) if company_element else ''
-            
-            # Extract location
-            location_element = soup.select_one(self.selectors['location'])
-            job_data['location'] = location_element.get_text(strip=True) if location_element else ''
-            
-            # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
-            job_data['description'] = desc_element.get_text(strip=True) if desc_element else ''
-            
-            # Extract salary (if available)
-            salary_element = soup.select_one(self.selectors['salary'])
-            if salary_element:
-                salary_text = salary_element.get_text(strip=True)
-                job_data['salary'] = salary_text
-                # TODO: Parse salary range into min/max values
-            
-            # Extract deadline
-            deadline_element = soup.select_one(self.selectors['deadline'])
-            job_data['deadline'] = deadline_element.get_text(strip=True) if deadline_element else ''
-            
-            # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
-            job_data['posted_date'] = posted_element.get_text(strip=True) if posted_element else ''
+            # Extract each field's text; salary is only recorded when present
+            # TODO: Parse salary range into min/max values
+            for field, name in DETAIL_FIELDS:
+                element = elements.get(name)
+                if element:
+                    job_data[field] = element.get_text(strip=True)
+                elif field != 'salary':
+                    job_data[field] = ''
             
             # TODO: Add more fields as needed
             # - job_type
@@ -120,11 +119,12 @@ class HamroJobsScraper(BaseScraper):
     def get_total_pages(self) -> int:
         """Get the total number of pages available."""
         try:
+            # Only the pagination markup is built into a tree
             response = self.make_request(self.search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=PAGINATION_STRAINER)
             
             # Find pagination elements
-            pagination_elements = soup.select(self.selectors['pagination'])
+            pagination_elements = self.selectors['pagination'].select(soup)
             
             if not pagination_elements:
                 return 1
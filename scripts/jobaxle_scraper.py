@@ -6,17 +6,30 @@ JobAxle provides JSON APIs that are much more reliable than HTML scraping.
 """
 
 import re
-import json
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
+import math
+import asyncio
+import threading
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
+import httpx
+import orjson
 
 from utils import BaseScraper
+from utils.base_scraper import TokenBucket
+
+# Upper bound on search API pages, whether counted or probed
+MAX_API_PAGES = 50
+
+# Date and time of the API's ISO 8601 timestamps (e.g. 2024-05-01T09:30:00.000Z)
+ISO_DATETIME_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})')
 
 
 class JobAxleScraper(BaseScraper):
     """Scraper for JobAxle job website using API endpoints."""
     
+    concurrent_details = True
+    listing_workers = 4
+    
     def __init__(self):
         super().__init__(
             website_name="jobaxle",
@@ -34,30 +47,41 @@ class JobAxleScraper(BaseScraper):
             'Referer': 'https://jobaxle.com/search'
         })
         
+        # Listing rows by page, kept from get_total_pages' probe so get_job_links
+        # need not request them again, and the same rows by slug for detail lookups
+        self._page_job_data: Dict[int, List[Dict[str, Any]]] = {}
+        self._jobs_by_slug: Dict[str, Dict[str, Any]] = {}
+        
+        # Pages that failed or had no rows; the lookup walk for unlisted
+        # jobs stops there instead of requesting them again for every slug
+        self._unavailable_pages: Set[int] = set()
+        # Detail lookups run in worker threads; one walk at a time
+        self._page_walk_lock = threading.Lock()
+        
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job data from JobAxle's API for a specific page."""
         params = {'page': page}
         
         try:
-            response = self.make_request(self.search_api_url, params=params)
-            data = response.json()
-            
-            if not data.get('success') or data.get('status') != 200:
-                self.logger.warning(f"API returned error: {data.get('message', 'Unknown error')}")
-                return []
-            
-            jobs_data = data.get('data', {}).get('rows', [])
+            jobs_data = self._page_job_data.get(page)
+            if jobs_data is None:
+                response = self.make_request(self.search_api_url, params=params)
+                data = orjson.loads(response.content)
+                
+                if not data.get('success') or data.get('status') != 200:
+                    self.logger.warning(f"API returned error: {data.get('message', 'Unknown error')}")
+                    return []
+                
+                jobs_data = data.get('data', {}).get('rows', [])
+                
+                # Store the job data for later use in scrape_job_details
+                self._store_page(page, jobs_data)
             
             # Instead of returning URLs, we'll return job IDs that can be used for detailed scraping
             job_ids = [job.get('id') for job in jobs_data if job.get('id')]
             
             self.logger.debug(f"Found {len(job_ids)} jobs on page {page}")
             
-            # Store the job data for later use in scrape_job_details
-            if not hasattr(self, '_page_job_data'):
-                self._page_job_data = {}
-            self._page_job_data[page] = jobs_data
-            
             # Return job URLs for compatibility with base class
             job_urls = []
             for job in jobs_data:
@@ -71,89 +95,165 @@ class JobAxleScraper(BaseScraper):
             self.logger.error(f"Error getting jobs from API page {page}: {str(e)}")
             return []
     
+    def _store_page(self, page: int, jobs_data: List[Dict[str, Any]]):
+        """Keep a page of listing rows, indexed by page and by slug."""
+        self._page_job_data[page] = jobs_data
+        for job in jobs_data:
+            if job.get('slug'):
+                self._jobs_by_slug.setdefault(job['slug'], job)
+    
     def scrape_job_details(self, job_url: str) -> Dict[str, Any]:
         """Extract job details using JobAxle's API and stored job data."""
         try:
-            # Extract job ID or slug from URL
-            job_slug = job_url.split('/')[-1] if job_url else ''
-            
-            # First, try to find job data from our stored page data
-            job_data = None
-            if hasattr(self, '_page_job_data'):
-                for page_data in self._page_job_data.values():
-                    for job in page_data:
-                        if job.get('slug') == job_slug:
-                            job_data = job
-                            break
-                    if job_data:
-                        break
-            
+            job_data = self._find_page_job(job_url)
             if not job_data:
                 self.logger.warning(f"Could not find job data for {job_url}")
                 return {'url': job_url, 'error': 'Job data not found'}
             
-            # Extract job information from API data
-            result = {'url': job_url}
+            # Try to get additional details from job detail API
+            job_detail = None
+            job_id = job_data.get('id')
+            if job_id:
+                try:
+                    detail_response = self.make_request(f"{self.job_detail_api_url}/{job_id}")
+                    job_detail = orjson.loads(detail_response.content)
+                except Exception as e:
+                    self.logger.warning(f"Could not fetch detailed job info for {job_id}: {str(e)}")
             
-            # Basic job information
-            result['title'] = job_data.get('jobTitle', '').strip()
-            result['job_type'] = job_data.get('workNature', '')  # on-site, remote, hybrid
-            result['posted_date'] = job_data.get('createdAt', '')
-            result['deadline'] = job_data.get('deadlineEndDate', '')
+            return self._build_job_data(job_url, job_data, job_detail)
             
-            # Company information
-            member = job_data.get('member', {})
-            result['company'] = member.get('fullName', '') if member else ''
+        except Exception as e:
+            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
+            return {'url': job_url, 'error': str(e)}
+    
+    async def _scrape_job_details_async(self, client: httpx.AsyncClient,
+                                        semaphore: asyncio.Semaphore,
+                                        rate_limiter: Optional[TokenBucket],
+                                        job_url: str) -> Dict[str, Any]:
+        """Fetch a job's detail record asynchronously, as scrape_job_details does."""
+        try:
+            # A miss may walk listing pages with blocking requests; keep that
+            # off the event loop so other detail fetches carry on
+            job_data = self._jobs_by_slug.get(job_url.split('/')[-1])
+            if job_data is None:
+                loop = asyncio.get_running_loop()
+                job_data = await loop.run_in_executor(None, self._find_page_job, job_url)
+            if not job_data:
+                self.logger.warning(f"Could not find job data for {job_url}")
+                return {'url': job_url, 'error': 'Job data not found'}
             
-            # Try to get additional details from job detail API
+            job_detail = None
             job_id = job_data.get('id')
             if job_id:
                 try:
                     detail_url = f"{self.job_detail_api_url}/{job_id}"
-                    detail_response = self.make_request(detail_url)
-                    detail_data = detail_response.json()
-                    
-                    if detail_data.get('success') and detail_data.get('data'):
-                        job_detail = detail_data['data']
-                        
-                        # Extract additional details
-                        result['description'] = job_detail.get('description', '')
-                        result['location'] = job_detail.get('location', '')
-                        result['salary'] = job_detail.get('salaryRange', '')
-                        result['experience_required'] = job_detail.get('experience', '')
-                        result['education_required'] = job_detail.get('education', '')
-                        result['requirements'] = job_detail.get('requirements', '')
-                        result['benefits'] = job_detail.get('benefits', '')
-                        result['skills'] = job_detail.get('skills', '')
-                        
-                        # Job category and industry
-                        if 'jobCategory' in job_detail:
-                            category = job_detail['jobCategory']
-                            result['job_category'] = category.get('categoryName', '') if category else ''
-                        
-                        # Employment details
-                        result['employment_type'] = job_detail.get('employmentType', '')
-                        result['job_level'] = job_detail.get('jobLevel', '')
-                        
+                    job_detail = orjson.loads(await self._fetch_async(client, semaphore, rate_limiter, detail_url))
                 except Exception as e:
                     self.logger.warning(f"Could not fetch detailed job info for {job_id}: {str(e)}")
             
-            # Format dates
-            for date_field in ['posted_date', 'deadline']:
-                if result.get(date_field):
-                    try:
-                        # Parse ISO date and format it nicely
-                        date_obj = datetime.fromisoformat(result[date_field].replace('Z', '+00:00'))
-                        result[date_field] = date_obj.strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        pass  # Keep original format if parsing fails
-            
-            return result
+            return self._build_job_data(job_url, job_data, job_detail)
             
         except Exception as e:
             self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
             return {'url': job_url, 'error': str(e)}
     
+    def _find_page_job(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the listing record for a job URL.
+        
+        Jobs not on a page read so far are looked for on the remaining
+        listing pages, so a URL can be scraped without walking the
+        listing first. The walk ends at the first page that failed or
+        had no rows, and such pages are not requested again.
+        
+        Args:
+            job_url: URL of the job posting
+            
+        Returns:
+            Listing record, or None if no listing page has the job
+        """
+        # Extract job ID or slug from URL
+        job_slug = job_url.split('/')[-1] if job_url else ''
+        
+        job = self._jobs_by_slug.get(job_slug)
+        if job is not None:
+            return job
+        
+        with self._page_walk_lock:
+            # Another lookup may have read the job's page while this one waited
+            job = self._jobs_by_slug.get(job_slug)
+            
+            page = 1
+            while job is None and page <= MAX_API_PAGES:
+                if page in self._unavailable_pages:
+                    break
+                if page not in self._page_job_data:
+                    self.get_job_links(page)
+                    if not self._page_job_data.get(page):
+                        # Past the last page, or the API failed
+                        self._unavailable_pages.add(page)
+                        break
+                    job = self._jobs_by_slug.get(job_slug)
+                page += 1
+        
+        return job
+    
+    def _build_job_data(self, job_url: str, job_data: Dict[str, Any],
+                        detail_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine a listing record and its detail API response into job data."""
+        # Extract job information from API data
+        result = {'url': job_url}
+        
+        # Basic job information
+        result['title'] = job_data.get('jobTitle', '').strip()
+        result['job_type'] = job_data.get('workNature', '')  # on-site, remote, hybrid
+        result['posted_date'] = job_data.get('createdAt', '')
+        result['deadline'] = job_data.get('deadlineEndDate', '')
+        
+        # Company information
+        member = job_data.get('member', {})
+        result['company'] = member.get('fullName', '') if member else ''
+        
+        if detail_data and detail_data.get('success') and detail_data.get('data'):
+            job_detail = detail_data['data']
+            
+            # Extract additional details
+            result['description'] = job_detail.get('description', '')
+            result['location'] = job_detail.get('location', '')
+            result['salary'] = job_detail.get('salaryRange', '')
+            result['experience_required'] = job_detail.get('experience', '')
+            result['education_required'] = job_detail.get('education', '')
+            result['requirements'] = job_detail.get('requirements', '')
+            result['benefits'] = job_detail.get('benefits', '')
+            result['skills'] = job_detail.get('skills', '')
+            
+            # Job category and industry
+            if 'jobCategory' in job_detail:
+                category = job_detail['jobCategory']
+                result['job_category'] = category.get('categoryName', '') if category else ''
+            
+            # Employment details
+            result['employment_type'] = job_detail.get('employmentType', '')
+            result['job_level'] = job_detail.get('jobLevel', '')
+        
+        # Format dates
+        for date_field in ['posted_date', 'deadline']:
+            if result.get(date_field):
+                # The usual ISO timestamp is reformatted by slicing out its parts
+                match = ISO_DATETIME_PATTERN.match(result[date_field])
+                if match:
+                    result[date_field] = f"{match.group(1)} {match.group(2)}"
+                    continue
+                
+                try:
+                    # Parse ISO date and format it nicely
+                    date_obj = datetime.fromisoformat(result[date_field].replace('Z', '+00:00'))
+                    result[date_field] = date_obj.strftime('%Y-%m-%d %H:%M:%S')
+                except:
+                    pass  # Keep original format if parsing fails
+        
+        return result
+    
     def get_total_pages(self) -> int:
         """Get the total number of pages available from JobAxle API."""
         try:
@@ -162,10 +262,10 @@ class JobAxleScraper(BaseScraper):
             page = 1
             max_pages = 1
             
-            while page <= 50:  # Safety limit
+            while page <= MAX_API_PAGES:  # Safety limit
                 params = {'page': page}
                 response = self.make_request(self.search_api_url, params=params)
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if not data.get('success') or data.get('status') != 200:
                     break
@@ -174,7 +274,16 @@ class JobAxleScraper(BaseScraper):
                 if not jobs:  # No more jobs on this page
                     break
                 
+                self._store_page(page, jobs)
                 max_pages = page
+                
+                # The search API reports the total match count next to the rows;
+                # with it, page 1 alone gives the page count
+                total = data['data'].get('count')
+                if page == 1 and isinstance(total, int) and total > 0:
+                    max_pages = min(math.ceil(total / len(jobs)), MAX_API_PAGES)
+                    break
+                
                 page += 1
                 
                 # If we get less than 10 jobs, this is likely the last page
@@ -5,14 +5,46 @@ URL: https://jobkunja.com
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import re
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from utils import BaseScraper
 
+# Selectors not in the site config, compiled once
+CARD_SELECTOR = sv.compile('.card')
+JOB_LISTING_SELECTOR = sv.compile('.card, .job-item, .vacancy, .job-listing')
+
+# Only elements whose class could match the card selectors above (and their
+# subtrees) are built when parsing the main and listing pages
+JOB_CARD_STRAINER = SoupStrainer(class_=re.compile('card|job|vacancy'))
+
+# Parts of a job card, found together in one walk of the card
+CARD_FIELD_SELECTORS = {
+    'title': sv.compile('h1, h2, h3, h4, h5, strong, b'),
+    'company': sv.compile('span[class*="company" i], div[class*="company" i], p[class*="company" i]'),
+    'location': sv.compile('span[class*="location" i], div[class*="location" i], p[class*="location" i]'),
+    'link': sv.compile('a[href]'),
+}
+CARD_FIELD_UNION_SELECTOR = sv.compile(', '.join(selector.pattern for selector in CARD_FIELD_SELECTORS.values()))
+
+# Text patterns applied to every card, compiled once
+# The place name before ", Nepal" is capped so a miss cannot rescan long runs of words
+LOCATION_PATTERN = re.compile(r'(Kathmandu|Lalitpur|Bhaktapur|Pokhara|\b[A-Za-z][A-Za-z\s]{1,30},\s*Nepal)', re.IGNORECASE)
+# Amounts must start with a currency word; the search starts at the first one
+SALARY_PATTERN = re.compile(r'\b(?:Rs\.?|NRS|NPR)\s*\d[\d,]*(?:\.\d+)?\s*(?:k|K|thousand|lakh)?(?:\s*-\s*(?:Rs\.?|NRS|NPR)?\s*\d[\d,]*(?:\.\d+)?\s*(?:k|K|thousand|lakh)?)?')
+CURRENCY_MARKER_PATTERN = re.compile(r'\b(?:Rs|NRS|NPR)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 class JobKunjaScraper(BaseScraper):
+    # Listing pages fetched at once; make_request still spaces request starts
+    listing_workers = 4
+    
     def __init__(self):
         super().__init__(
             website_name="jobkunja",
@@ -21,6 +53,13 @@ class JobKunjaScraper(BaseScraper):
         )
         self.name = "JobKunja"
         self.source_url = self.base_url
+        # Stamped on every job; refreshed at the start of each scrape_jobs run
+        self._today = datetime.now().strftime('%Y-%m-%d')
+        
+        # (title, company) keys of jobs extracted in this run; pages are
+        # parsed in threads, so checks and adds go through the lock
+        self._seen_jobs = set()
+        self._seen_jobs_lock = threading.Lock()
     
     def get_job_links(self, page_num: int = 1) -> List[str]:
         """Get job links from the page"""
@@ -39,12 +78,10 @@ class JobKunjaScraper(BaseScraper):
         Scrape jobs from JobKunja
         """
         all_jobs = []
+        self._today = datetime.now().strftime('%Y-%m-%d')
+        self._seen_jobs = set()
         
         try:
-            # Start with main page to find job listings
-            main_page_jobs = self._scrape_main_page()
-            all_jobs.extend(main_page_jobs)
-            
             # Try to find dedicated job listing pages
             job_listing_pages = [
                 f"{self.base_url}/jobs/search",
@@ -52,21 +89,25 @@ class JobKunjaScraper(BaseScraper):
                 f"{self.base_url}/job_type/hot_job"
             ]
             
-            for page_url in job_listing_pages:
-                try:
-                    self.logger.info(f"Scraping page: {page_url}")
-                    page_jobs = self._scrape_job_listing_page(page_url)
-                    all_jobs.extend(page_jobs)
-                    time.sleep(self.delay)
-                except Exception as e:
-                    self.logger.warning(f"Error scraping {page_url}: {e}")
-                    continue
-            
-            # Remove duplicates based on job title and company
-            unique_jobs = self._remove_duplicates(all_jobs)
+            with ThreadPoolExecutor(max_workers=self.listing_workers) as pool:
+                # Start with main page to find job listings
+                main_page_future = pool.submit(self._scrape_main_page)
+                page_futures = [(page_url, pool.submit(self._scrape_job_listing_page, page_url))
+                                for page_url in job_listing_pages]
+                
+                # Duplicates were already dropped in the threads through _seen_jobs, so
+                # a job on several pages is kept from whichever page reached it first
+                all_jobs.extend(main_page_future.result())
+                for page_url, future in page_futures:
+                    try:
+                        all_jobs.extend(future.result())
+                    except Exception as e:
+                        self.logger.warning(f"Error scraping {page_url}: {e}")
+                        continue
             
-            self.logger.info(f"Successfully scraped {len(unique_jobs)} unique jobs from {self.name}")
-            return unique_jobs
+            # Duplicates by title and company were already dropped during extraction
+            self.logger.info(f"Successfully scraped {len(all_jobs)} unique jobs from {self.name}")
+            return all_jobs
             
         except Exception as e:
             self.logger.error(f"Error in scraping {self.name}: {e}")
@@ -81,10 +122,10 @@ class JobKunjaScraper(BaseScraper):
             if not response:
                 return jobs
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=JOB_CARD_STRAINER)
             
             # Look for job cards
-            job_cards = soup.select('.card')
+            job_cards = CARD_SELECTOR.select(soup)
             self.logger.info(f"Found {len(job_cards)} job cards on main page")
             
             for card in job_cards:
@@ -102,14 +143,15 @@ class JobKunjaScraper(BaseScraper):
         jobs = []
         
         try:
+            self.logger.info(f"Scraping page: {url}")
             response = self.make_request(url)
             if not response:
                 return jobs
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=JOB_CARD_STRAINER)
             
             # Look for job listings with various selectors
-            job_elements = soup.select('.card, .job-item, .vacancy, .job-listing')
+            job_elements = JOB_LISTING_SELECTOR.select(soup)
             self.logger.info(f"Found {len(job_elements)} job elements on {url}")
             
             for element in job_elements:
@@ -126,64 +168,87 @@ class JobKunjaScraper(BaseScraper):
         """Extract job information from a card element"""
         try:
             job = {}
+            elements = self.select_fields(card, CARD_FIELD_SELECTORS, CARD_FIELD_UNION_SELECTOR)
+            # Walked at most once, and only if a fallback below needs the card's strings
+            strings = None
             
             # Extract job title (look for headings or strong text)
-            title_elem = card.find(['h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b'])
+            title_elem = elements.get('title')
             if title_elem:
                 job['title'] = title_elem.get_text().strip()
             else:
                 # Try to get first meaningful text
-                texts = [text.strip() for text in card.stripped_strings if len(text.strip()) > 3]
+                strings = list(card.stripped_strings)
+                texts = [text for text in strings if len(text) > 3]
                 if texts:
                     job['title'] = texts[0]
                 else:
                     return None
             
             # Extract company name (usually appears after title)
-            company_elem = card.find(['span', 'div', 'p'], class_=lambda x: x and 'company' in x.lower())
+            company_elem = elements.get('company')
             if company_elem:
                 job['company'] = company_elem.get_text().strip()
             else:
                 # Try to find company in text patterns
-                texts = list(card.stripped_strings)
+                if strings is None:
+                    strings = list(card.stripped_strings)
+                texts = strings
                 for i, text in enumerate(texts):
-                    if 'pvt' in text.lower() or 'ltd' in text.lower() or 'company' in text.lower():
+                    text_lower = text.lower()
+                    if 'pvt' in text_lower or 'ltd' in text_lower or 'company' in text_lower:
                         job['company'] = text.strip()
                         break
                 if 'company' not in job and len(texts) > 1:
                     job['company'] = texts[1] if texts[1] != job.get('title') else 'Not specified'
             
+            # Validate required fields
+            if not job.get('title') or len(job['title']) < 3:
+                return None
+            
+            # Clean up title
+            job['title'] = WHITESPACE_PATTERN.sub(' ', job['title']).strip()
+            
+            # Skip jobs already seen on another page before the text pattern work below
+            key = (job['title'].lower(), job.get('company', '').strip().lower())
+            with self._seen_jobs_lock:
+                if key in self._seen_jobs:
+                    return None
+                self._seen_jobs.add(key)
+            
+            card_text = card.get_text()
+            card_text_lower = card_text.lower()
+            
             # Extract location
-            location_elem = card.find(['span', 'div', 'p'], class_=lambda x: x and 'location' in x.lower())
+            location_elem = elements.get('location')
             if location_elem:
                 job['location'] = location_elem.get_text().strip()
             else:
                 # Look for location patterns in text
-                text_content = card.get_text()
-                location_match = re.search(r'(Kathmandu|Lalitpur|Bhaktapur|Pokhara|[A-Za-z\s]+,\s*Nepal)', text_content, re.IGNORECASE)
+                location_match = LOCATION_PATTERN.search(card_text)
                 if location_match:
                     job['location'] = location_match.group(1)
                 else:
                     job['location'] = 'Nepal'
             
             # Look for job link
-            link_elem = card.find('a', href=True)
+            link_elem = elements.get('link')
             if link_elem:
-                job['job_url'] = urljoin(self.base_url, link_elem['href'])
-            
-            # Extract other details from text
-            card_text = card.get_text()
+                job['job_url'] = self.absolute_url(link_elem['href'])
             
             # Look for job type
-            if any(word in card_text.lower() for word in ['full time', 'full-time']):
+            if 'full time' in card_text_lower or 'full-time' in card_text_lower:
                 job['job_type'] = 'Full Time'
-            elif any(word in card_text.lower() for word in ['part time', 'part-time']):
+            elif 'part time' in card_text_lower or 'part-time' in card_text_lower:
                 job['job_type'] = 'Part Time'
             else:
                 job['job_type'] = 'Not specified'
             
             # Look for salary information
-            salary_match = re.search(r'(?:Rs\.?|NRS|NPR)?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|K|thousand|lakh)?(?:\s*-\s*(?:Rs\.?|NRS|NPR)?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|K|thousand|lakh)?)?', card_text)
+            salary_match = None
+            marker = CURRENCY_MARKER_PATTERN.search(card_text)
+            if marker:
+                salary_match = SALARY_PATTERN.search(card_text, marker.start())
             if salary_match:
                 job['salary'] = salary_match.group(0)
             else:
@@ -192,15 +257,7 @@ class JobKunjaScraper(BaseScraper):
             # Add metadata
             job['source'] = self.name
             job['source_url'] = self.source_url
-            from datetime import datetime
-            job['scraped_date'] = datetime.now().strftime('%Y-%m-%d')
-            
-            # Validate required fields
-            if not job.get('title') or len(job['title']) < 3:
-                return None
-            
-            # Clean up title
-            job['title'] = re.sub(r'\s+', ' ', job['title']).strip()
+            job['scraped_date'] = self._today
             
             return job
             
@@ -211,20 +268,7 @@ class JobKunjaScraper(BaseScraper):
     def _extract_job_from_element(self, element):
         """Extract job from generic element (fallback method)"""
         return self._extract_job_from_card(element)
-    
-    def _remove_duplicates(self, jobs):
-        """Remove duplicate jobs based on title and company"""
-        seen = set()
-        unique_jobs = []
-        
-        for job in jobs:
-            # Create a key based on title and company (case-insensitive)
-            key = (job.get('title', '').lower().strip(), job.get('company', '').lower().strip())
-            if key not in seen and key[0]:  # Ensure title is not empty
-                seen.add(key)
-                unique_jobs.append(job)
-        
-        return unique_jobs
+
 
 def main():
     """Test the scraper"""
@@ -5,14 +5,57 @@ URL: https://kantipurjob.com
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 import re
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin, parse_qs, urlparse
+from urllib.parse import parse_qs, urlparse
 from utils import BaseScraper
 
+# Selectors not in the site config, compiled once
+MAIN_PAGE_JOB_SELECTOR = sv.compile('.job-item, .job-card, .vacancy, .position, .job-listing')
+CATEGORY_JOB_SELECTOR = sv.compile('.job-item, .job-card, .vacancy, .position, .job-listing, .job')
+
+# Fallbacks for pages without the usual job classes: any class mentioning a job word
+JOB_CLASS_WORDS = ('job', 'vacancy', 'position')
+MAIN_PAGE_FALLBACK_SELECTOR = sv.compile(', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'li') for word in JOB_CLASS_WORDS
+))
+CATEGORY_FALLBACK_SELECTOR = sv.compile(', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'li', 'tr') for word in JOB_CLASS_WORDS
+))
+
+# Category pages are parsed only where a class mentions a job word, which
+# covers both the category selector and its fallback
+CATEGORY_STRAINER = SoupStrainer(class_=re.compile('|'.join(JOB_CLASS_WORDS), re.IGNORECASE))
+
+# Parts of a job element, found together in one walk of the element
+ELEMENT_FIELD_SELECTORS = {
+    'title': sv.compile('h1, h2, h3, h4, h5, strong, b, a'),
+    'link': sv.compile('a[href]'),
+}
+ELEMENT_FIELD_UNION_SELECTOR = sv.compile(', '.join(selector.pattern for selector in ELEMENT_FIELD_SELECTORS.values()))
+
+# Category link and job element text patterns, compiled once
+CATEGORY_PATTERN = re.compile(r'^(.+?)\s*\((\d+)\)$')
+# Each label group is one alternation, so the text is scanned once per field
+COMPANY_LABEL_PATTERN = re.compile(r'(?:Company|Employer|Organization):\s*([^\n\r]+)', re.IGNORECASE)
+LOCATION_LABEL_PATTERN = re.compile(r'(?:Location|Place|Address):\s*([^\n\r]+)', re.IGNORECASE)
+# The place name before ", Nepal" is capped so a miss cannot rescan long runs of words
+LOCATION_PATTERN = re.compile(r'(Kathmandu|Lalitpur|Bhaktapur|Pokhara|\b[A-Za-z][A-Za-z\s]{1,30},\s*Nepal)', re.IGNORECASE)
+SALARY_LABEL_PATTERN = re.compile(r'(?:Salary|Pay):\s*([^\n\r]+)', re.IGNORECASE)
+# Amounts must start with a currency word; the search starts at the first one
+SALARY_PATTERN = re.compile(r'\b(?:Rs\.?|NRS|NPR)\s*\d[\d,]*(?:\.\d+)?\s*(?:k|K|thousand|lakh)?(?:\s*-\s*(?:Rs\.?|NRS|NPR)?\s*\d[\d,]*(?:\.\d+)?\s*(?:k|K|thousand|lakh)?)?', re.IGNORECASE)
+CURRENCY_MARKER_PATTERN = re.compile(r'\b(?:Rs|NRS|NPR)', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 class KantipurJobScraper(BaseScraper):
+    # Category pages fetched at once; make_request still spaces request starts
+    listing_workers = 4
+    
     def __init__(self):
         super().__init__(
             website_name="kantipurjob",
@@ -21,6 +64,8 @@ class KantipurJobScraper(BaseScraper):
         )
         self.name = "KantipurJob"
         self.source_url = self.base_url
+        # Stamped on every job; refreshed at the start of each scrape_jobs run
+        self._today = datetime.now().strftime('%Y-%m-%d')
     
     def get_job_links(self, page_num: int = 1) -> List[str]:
         """Get job links from the page"""
@@ -39,6 +84,7 @@ class KantipurJobScraper(BaseScraper):
         Scrape jobs from KantipurJob
         """
         all_jobs = []
+        self._today = datetime.now().strftime('%Y-%m-%d')
         
         try:
             # Get job categories first
@@ -51,15 +97,17 @@ class KantipurJobScraper(BaseScraper):
                 all_jobs.extend(main_jobs)
             else:
                 # Scrape jobs from each category
-                for category in categories[:10]:  # Limit to prevent too many requests
-                    try:
-                        self.logger.info(f"Scraping category: {category['name']}")
-                        category_jobs = self._scrape_category(category)
-                        all_jobs.extend(category_jobs)
-                        time.sleep(self.delay)
-                    except Exception as e:
-                        self.logger.warning(f"Error scraping category {category['name']}: {e}")
-                        continue
+                categories = categories[:10]  # Limit to prevent too many requests
+                with ThreadPoolExecutor(max_workers=min(self.listing_workers, len(categories))) as pool:
+                    futures = [(category, pool.submit(self._scrape_category, category)) for category in categories]
+                    
+                    # Collected in category order so duplicates resolve the same way every run
+                    for category, future in futures:
+                        try:
+                            all_jobs.extend(future.result())
+                        except Exception as e:
+                            self.logger.warning(f"Error scraping category {category['name']}: {e}")
+                            continue
             
             # Remove duplicates
             unique_jobs = self._remove_duplicates(all_jobs)
@@ -76,11 +124,7 @@ class KantipurJobScraper(BaseScraper):
         categories = []
         
         try:
-            response = self.make_request(self.base_url)
-            if not response:
-                return categories
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(self.base_url)
             
             # Look for category links with job counts
             category_links = soup.find_all('a', href=True)
@@ -92,7 +136,7 @@ class KantipurJobScraper(BaseScraper):
                 # Look for patterns like "Category Name (5)" indicating job count
                 if '(' in text and ')' in text and any(char.isdigit() for char in text):
                     # Extract category name and count
-                    match = re.match(r'^(.+?)\s*\((\d+)\)$', text)
+                    match = CATEGORY_PATTERN.match(text)
                     if match:
                         category_name = match.group(1).strip()
                         job_count = int(match.group(2))
@@ -100,7 +144,7 @@ class KantipurJobScraper(BaseScraper):
                         if job_count > 0:  # Only include categories with jobs
                             categories.append({
                                 'name': category_name,
-                                'url': urljoin(self.base_url, href),
+                                'url': self.absolute_url(href),
                                 'count': job_count
                             })
             
@@ -117,18 +161,14 @@ class KantipurJobScraper(BaseScraper):
         jobs = []
         
         try:
-            response = self.make_request(self.base_url)
-            if not response:
-                return jobs
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(self.base_url)
             
             # Look for job listings
-            job_elements = soup.select('.job-item, .job-card, .vacancy, .position, .job-listing')
+            job_elements = MAIN_PAGE_JOB_SELECTOR.select(soup)
             
             if not job_elements:
                 # Try to find any elements that might contain job information
-                job_elements = soup.find_all(['div', 'li'], class_=lambda x: x and any(word in x.lower() for word in ['job', 'vacancy', 'position']))
+                job_elements = MAIN_PAGE_FALLBACK_SELECTOR.select(soup)
             
             self.logger.info(f"Found {len(job_elements)} potential job elements on main page")
             
@@ -147,18 +187,19 @@ class KantipurJobScraper(BaseScraper):
         jobs = []
         
         try:
+            self.logger.info(f"Scraping category: {category['name']}")
             response = self.make_request(category['url'])
             if not response:
                 return jobs
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=CATEGORY_STRAINER)
             
             # Look for job listings in category page
-            job_elements = soup.select('.job-item, .job-card, .vacancy, .position, .job-listing, .job')
+            job_elements = CATEGORY_JOB_SELECTOR.select(soup)
             
             if not job_elements:
                 # Try alternative selectors
-                job_elements = soup.find_all(['div', 'li', 'tr'], class_=lambda x: x and any(word in x.lower() for word in ['job', 'vacancy', 'position']))
+                job_elements = CATEGORY_FALLBACK_SELECTOR.select(soup)
             
             self.logger.info(f"Found {len(job_elements)} job elements in category {category['name']}")
             
@@ -177,16 +218,18 @@ class KantipurJobScraper(BaseScraper):
         """Extract job information from an element"""
         try:
             job = {}
+            elements = self.select_fields(element, ELEMENT_FIELD_SELECTORS, ELEMENT_FIELD_UNION_SELECTOR)
+            texts = list(element.stripped_strings)
             
             # Extract job title
-            title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b', 'a'])
+            title_elem = elements.get('title')
             if title_elem:
                 job['title'] = title_elem.get_text().strip()
             else:
                 # Try to get meaningful text
-                texts = [text.strip() for text in element.stripped_strings if len(text.strip()) > 5]
-                if texts:
-                    job['title'] = texts[0]
+                long_texts = [text for text in texts if len(text) > 5]
+                if long_texts:
+                    job['title'] = long_texts[0]
                 else:
                     return None
             
@@ -198,21 +241,13 @@ class KantipurJobScraper(BaseScraper):
             
             # Extract company name
             element_text = element.get_text()
-            texts = list(element.stripped_strings)
+            element_text_lower = element_text.lower()
             
             # Look for company patterns
-            company_patterns = [
-                r'Company:\s*([^\n\r]+)',
-                r'Employer:\s*([^\n\r]+)',
-                r'Organization:\s*([^\n\r]+)'
-            ]
-            
             job['company'] = 'Not specified'
-            for pattern in company_patterns:
-                match = re.search(pattern, element_text, re.IGNORECASE)
-                if match:
-                    job['company'] = match.group(1).strip()
-                    break
+            match = COMPANY_LABEL_PATTERN.search(element_text)
+            if match:
+                job['company'] = match.group(1).strip()
             
             # If no explicit company found, look for company-like text
             if job['company'] == 'Not specified':
@@ -223,66 +258,53 @@ class KantipurJobScraper(BaseScraper):
                         break
             
             # Extract location
-            location_patterns = [
-                r'Location:\s*([^\n\r]+)',
-                r'Place:\s*([^\n\r]+)',
-                r'Address:\s*([^\n\r]+)'
-            ]
-            
             job['location'] = 'Nepal'
-            for pattern in location_patterns:
-                match = re.search(pattern, element_text, re.IGNORECASE)
-                if match:
-                    job['location'] = match.group(1).strip()
-                    break
+            match = LOCATION_LABEL_PATTERN.search(element_text)
+            if match:
+                job['location'] = match.group(1).strip()
             
             # If no explicit location, look for location keywords
             if job['location'] == 'Nepal':
-                location_match = re.search(r'(Kathmandu|Lalitpur|Bhaktapur|Pokhara|[A-Za-z\s]+,\s*Nepal)', element_text, re.IGNORECASE)
+                location_match = LOCATION_PATTERN.search(element_text)
                 if location_match:
                     job['location'] = location_match.group(1)
             
             # Look for job link
-            link_elem = element.find('a', href=True)
+            link_elem = elements.get('link')
             if link_elem and link_elem.get('href'):
                 href = link_elem['href']
                 if href.startswith('http'):
                     job['job_url'] = href
                 else:
-                    job['job_url'] = urljoin(self.base_url, href)
+                    job['job_url'] = self.absolute_url(href)
             
             # Extract job type
-            if any(word in element_text.lower() for word in ['full time', 'full-time']):
+            if 'full time' in element_text_lower or 'full-time' in element_text_lower:
                 job['job_type'] = 'Full Time'
-            elif any(word in element_text.lower() for word in ['part time', 'part-time']):
+            elif 'part time' in element_text_lower or 'part-time' in element_text_lower:
                 job['job_type'] = 'Part Time'
-            elif any(word in element_text.lower() for word in ['contract']):
+            elif 'contract' in element_text_lower:
                 job['job_type'] = 'Contract'
             else:
                 job['job_type'] = 'Not specified'
             
             # Look for salary
-            salary_patterns = [
-                r'Salary:\s*([^\n\r]+)',
-                r'Pay:\s*([^\n\r]+)',
-                r'(?:Rs\.?|NRS|NPR)?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|K|thousand|lakh)?(?:\s*-\s*(?:Rs\.?|NRS|NPR)?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|K|thousand|lakh)?)?'
-            ]
-            
             job['salary'] = 'Not specified'
-            for pattern in salary_patterns:
-                match = re.search(pattern, element_text, re.IGNORECASE)
-                if match:
-                    job['salary'] = match.group(0) if 'Salary:' in match.group(0) else match.group(0)
-                    break
+            match = SALARY_LABEL_PATTERN.search(element_text)
+            if not match:
+                marker = CURRENCY_MARKER_PATTERN.search(element_text)
+                if marker:
+                    match = SALARY_PATTERN.search(element_text, marker.start())
+            if match:
+                job['salary'] = match.group(0)
             
             # Add metadata
             job['source'] = self.name
             job['source_url'] = self.source_url
-            from datetime import datetime
-            job['scraped_date'] = datetime.now().strftime('%Y-%m-%d')
+            job['scraped_date'] = self._today
             
             # Clean up title
-            job['title'] = re.sub(r'\s+', ' ', job['title']).strip()
+            job['title'] = WHITESPACE_PATTERN.sub(' ', job['title']).strip()
             
             return job
             
@@ -292,16 +314,15 @@ class KantipurJobScraper(BaseScraper):
     
     def _remove_duplicates(self, jobs):
         """Remove duplicate jobs"""
-        seen = set()
-        unique_jobs = []
+        # Keyed by title and company; dicts keep the first job in insertion order
+        unique_jobs = {}
         
         for job in jobs:
-            key = (job.get('title', '').lower().strip(), job.get('company', '').lower().strip())
-            if key not in seen and key[0]:
-                seen.add(key)
-                unique_jobs.append(job)
+            key = ((job.get('title') or '').strip().lower(), (job.get('company') or '').strip().lower())
+            if key[0] and key not in unique_jobs:
+                unique_jobs[key] = job
         
-        return unique_jobs
+        return list(unique_jobs.values())
 
 def main():
     """Test the scraper"""
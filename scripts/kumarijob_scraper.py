@@ -5,13 +5,24 @@ URL: https://www.kumarijob.com
 """
 
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 import time
 import re
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from utils import BaseScraper
 
+# Selectors not in the site config, compiled once
+JOB_LISTING_SELECTOR = sv.compile('.job-item, .job-card, .job-listing, .job, .vacancy')
+
+# Class matchers for the fallbacks when no job selector matches; bs4 tests
+# a compiled pattern against each class without a Python call per tag
+MAIN_PAGE_CLASS_PATTERN = re.compile('job|vacancy|company|position', re.IGNORECASE)
+JOB_CLASS_PATTERN = re.compile('job|vacancy|position', re.IGNORECASE)
+
+
 class KumariJobScraper(BaseScraper):
     def __init__(self):
         super().__init__(
@@ -21,6 +32,8 @@ class KumariJobScraper(BaseScraper):
         )
         self.name = "KumariJob"
         self.source_url = self.base_url
+        # Stamped on every job; refreshed at the start of each scrape_jobs run
+        self._today = datetime.now().strftime('%Y-%m-%d')
         self.max_retries = 3
     
     def get_job_links(self, page_num: int = 1) -> List[str]:
@@ -40,6 +53,7 @@ class KumariJobScraper(BaseScraper):
         Scrape jobs from KumariJob with retry logic
         """
         all_jobs = []
+        self._today = datetime.now().strftime('%Y-%m-%d')
         
         try:
             # Start with main page
@@ -105,9 +119,7 @@ class KumariJobScraper(BaseScraper):
                 
                 # If no specific job selectors work, look for company/job related elements
                 if not job_elements:
-                    job_elements = soup.find_all(['div', 'li'], class_=lambda x: x and any(
-                        word in x.lower() for word in ['job', 'vacancy', 'company', 'position']
-                    ))
+                    job_elements = soup.find_all(['div', 'li'], class_=MAIN_PAGE_CLASS_PATTERN)
                     self.logger.info(f"Found {len(job_elements)} potential job elements")
                 
                 for element in job_elements:
@@ -145,12 +157,10 @@ class KumariJobScraper(BaseScraper):
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
                 # Look for job elements
-                job_elements = soup.select('.job-item, .job-card, .job-listing, .job, .vacancy')
+                job_elements = JOB_LISTING_SELECTOR.select(soup)
                 
                 if not job_elements:
-                    job_elements = soup.find_all(['div', 'li'], class_=lambda x: x and any(
-                        word in x.lower() for word in ['job', 'vacancy', 'position']
-                    ))
+                    job_elements = soup.find_all(['div', 'li'], class_=JOB_CLASS_PATTERN)
                 
                 self.logger.info(f"Found {len(job_elements)} job elements on {url}")
                 
@@ -193,6 +203,7 @@ class KumariJobScraper(BaseScraper):
             
             # Extract company name
             element_text = element.get_text()
+            element_text_lower = element_text.lower()
             texts = list(element.stripped_strings)
             
             # Look for company patterns
@@ -244,14 +255,14 @@ class KumariJobScraper(BaseScraper):
                 if href.startswith('http'):
                     job['job_url'] = href
                 else:
-                    job['job_url'] = urljoin(self.base_url, href)
+                    job['job_url'] = self.absolute_url(href)
             
             # Extract job type
-            if any(word in element_text.lower() for word in ['full time', 'full-time']):
+            if 'full time' in element_text_lower or 'full-time' in element_text_lower:
                 job['job_type'] = 'Full Time'
-            elif any(word in element_text.lower() for word in ['part time', 'part-time']):
+            elif 'part time' in element_text_lower or 'part-time' in element_text_lower:
                 job['job_type'] = 'Part Time'
-            elif any(word in element_text.lower() for word in ['contract']):
+            elif 'contract' in element_text_lower:
                 job['job_type'] = 'Contract'
             else:
                 job['job_type'] = 'Not specified'
@@ -273,8 +284,7 @@ class KumariJobScraper(BaseScraper):
             # Add metadata
             job['source'] = self.name
             job['source_url'] = self.source_url
-            from datetime import datetime
-            job['scraped_date'] = datetime.now().strftime('%Y-%m-%d')
+            job['scraped_date'] = self._today
             
             # Clean up title
             job['title'] = re.sub(r'\s+', ' ', job['title']).strip()
@@ -287,16 +297,15 @@ class KumariJobScraper(BaseScraper):
     
     def _remove_duplicates(self, jobs):
         """Remove duplicate jobs"""
-        seen = set()
-        unique_jobs = []
+        # Keyed by title and company; dicts keep the first job in insertion order
+        unique_jobs = {}
         
         for job in jobs:
-            key = (job.get('title', '').lower().strip(), job.get('company', '').lower().strip())
-            if key not in seen and key[0]:
-                seen.add(key)
-                unique_jobs.append(job)
+            key = ((job.get('title') or '').strip().lower(), (job.get('company') or '').strip().lower())
+            if key[0] and key not in unique_jobs:
+                unique_jobs[key] = job
         
-        return unique_jobs
+        return list(unique_jobs.values())
 
 def main():
     """Test the scraper"""
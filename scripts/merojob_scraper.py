@@ -8,14 +8,40 @@ based on the actual website structure.
 import re
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from utils import BaseScraper
+from config.settings import COMPILED_SELECTORS
+
+# Selectors not in the site config, compiled once
+TITLE_FALLBACK_SELECTOR = sv.compile('h1.text-primary')
+COMPANY_SELECTOR = sv.compile('.text-dark')
+COMPANY_FALLBACK_SELECTOR = sv.compile('[itemprop="hiringOrganization"] [itemprop="name"]')
+REQUIREMENTS_SELECTOR = sv.compile('.job-requirement, .requirements, .qualification')
+CONTACT_SELECTOR = sv.compile('.contact-info, .contact')
+
+
+def parse_job_links(content: bytes, base_url: str) -> List[str]:
+    """Extract absolute job links from a search results page."""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    job_links = []
+    for element in COMPILED_SELECTORS["merojob"]['job_links'].select(soup):
+        href = element.get('href')
+        if href:
+            # Convert relative URLs to absolute
+            job_links.append(urljoin(base_url, href))
+    
+    return job_links
 
 
 class MerojobScraper(BaseScraper):
     """Scraper for Merojob job website."""
     
+    # Module-level so listing pages can be parsed in worker processes
+    job_links_parser = staticmethod(parse_job_links)
+    
     def __init__(self):
         super().__init__(
             website_name="merojob",
@@ -24,39 +50,17 @@ class MerojobScraper(BaseScraper):
         )
         
         self.search_url = "https://merojob.com/search/"
-        self.selectors = {
-            "job_links": ".job-card h1.text-primary a",
-            "pagination": ".pagination a",
-            "job_title": "h1[itemprop='title']",
-            "company": ".text-dark",
-            "location": "[itemprop='addressLocality']",
-            "description": "[itemprop='description']",
-            "salary": ".salary-info",
-            "deadline": ".card-footer .text-primary",
-            "posted_date": "[itemprop='datePosted']",
-            "skills": "[itemprop='skills'] .badge",
-            "employment_type": "[itemprop='employmentType']"
-}
+        self.selectors = COMPILED_SELECTORS["merojob"]
         
+    def listing_url(self, page: int) -> str:
+        """Get the search results URL for a page."""
+        return f"{self.search_url}?page={page}"
+    
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from a search results page."""
-        # Construct search URL for the page
-        search_url = f"{self.search_url}?page={page}"
-        
         try:
-            response = self.make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job links using configured selector
-            job_elements = soup.select(self.selectors['job_links'])
-            
-            job_links = []
-            for element in job_elements:
-                href = element.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    job_url = urljoin(self.base_url, href)
-                    job_links.append(job_url)
+            response = self.make_request(self.listing_url(page))
+            job_links = parse_job_links(response.content, self.base_url)
             
             self.logger.debug(f"Found {len(job_links)} jobs on page {page}")
             return job_links
@@ -74,50 +78,50 @@ class MerojobScraper(BaseScraper):
             job_data = {'url': job_url}
             
             # Extract job title
-            title_element = soup.select_one(self.selectors['job_title'])
+            title_element = self.selectors['job_title'].select_one(soup)
             if title_element:
                 # Remove extra content and clean title
                 title_text = title_element.get_text(strip=True)
                 job_data['title'] = title_text
             else:
                 # Fallback to h1 with text-primary class
-                title_element = soup.select_one('h1.text-primary')
+                title_element = TITLE_FALLBACK_SELECTOR.select_one(soup)
                 job_data['title'] = title_element.get_text(strip=True) if title_element else ''
             
             # Extract company name - try multiple selectors
-            company_element = soup.select_one('.text-dark')
+            company_element = COMPANY_SELECTOR.select_one(soup)
             if not company_element:
-                company_element = soup.select_one('[itemprop="hiringOrganization"] [itemprop="name"]')
+                company_element = COMPANY_FALLBACK_SELECTOR.select_one(soup)
             if company_element:
                 job_data['company'] = company_element.get_text(strip=True)
             else:
                 job_data['company'] = ''
             
             # Extract location
-            location_element = soup.select_one(self.selectors['location'])
+            location_element = self.selectors['location'].select_one(soup)
             job_data['location'] = location_element.get_text(strip=True) if location_element else ''
             
             # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
+            desc_element = self.selectors['description'].select_one(soup)
             if desc_element:
                 job_data['description'] = desc_element.get('content', desc_element.get_text(strip=True))
             else:
                 job_data['description'] = ''
             
             # Extract employment type
-            employment_element = soup.select_one(self.selectors['employment_type'])
+            employment_element = self.selectors['employment_type'].select_one(soup)
             if employment_element:
                 job_data['job_type'] = employment_element.get('content', employment_element.get_text(strip=True))
             else:
                 job_data['job_type'] = ''
             
             # Extract skills
-            skill_elements = soup.select(self.selectors['skills'])
+            skill_elements = self.selectors['skills'].select(soup)
             skills = [skill.get_text(strip=True) for skill in skill_elements]
             job_data['skills'] = ', '.join(skills) if skills else ''
             
             # Extract salary (if available)
-            salary_element = soup.select_one(self.selectors['salary'])
+            salary_element = self.selectors['salary'].select_one(soup)
             if salary_element:
                 salary_text = salary_element.get_text(strip=True)
                 job_data['salary'] = salary_text
@@ -125,7 +129,7 @@ class MerojobScraper(BaseScraper):
                 job_data['salary'] = ''
             
             # Extract deadline - clean up the text
-            deadline_element = soup.select_one(self.selectors['deadline'])
+            deadline_element = self.selectors['deadline'].select_one(soup)
             if deadline_element:
                 deadline_text = deadline_element.get_text(strip=True)
                 # Extract just the date part
@@ -136,7 +140,7 @@ class MerojobScraper(BaseScraper):
                 job_data['deadline'] = ''
             
             # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
+            posted_element = self.selectors['posted_date'].select_one(soup)
             if posted_element:
                 posted_date = posted_element.get('content', posted_element.get_text(strip=True))
                 job_data['posted_date'] = posted_date
@@ -145,14 +149,14 @@ class MerojobScraper(BaseScraper):
             
             # Try to extract additional information from job detail page
             # Look for job requirements, qualifications, etc.
-            requirements_element = soup.select_one('.job-requirement, .requirements, .qualification')
+            requirements_element = REQUIREMENTS_SELECTOR.select_one(soup)
             if requirements_element:
                 job_data['requirements'] = requirements_element.get_text(strip=True)
             else:
                 job_data['requirements'] = ''
             
             # Extract contact information if available
-            contact_element = soup.select_one('.contact-info, .contact')
+            contact_element = CONTACT_SELECTOR.select_one(soup)
             if contact_element:
                 job_data['contact_info'] = contact_element.get_text(strip=True)
             else:
@@ -171,7 +175,7 @@ class MerojobScraper(BaseScraper):
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Find pagination elements
-            pagination_elements = soup.select(self.selectors['pagination'])
+            pagination_elements = self.selectors['pagination'].select(soup)
             
             if not pagination_elements:
                 return 1
@@ -7,10 +7,10 @@ based on the actual website structure.
 
 import re
 from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
 from utils import BaseScraper
+from config.settings import COMPILED_SELECTORS
 
 
 class MustakbilNepalScraper(BaseScraper):
@@ -24,18 +24,7 @@ class MustakbilNepalScraper(BaseScraper):
         )
         
         self.search_url = "https://np.mustakbil.com/jobs/nepal"
-        self.selectors = {
-            "job_links": "a[href*='job']",
-            "job_containers": "[class*='job']",
-            "pagination": "[class*='page']",
-            "job_title": "h1, .job-title, .title",
-            "company": ".company-name, .company, .employer",
-            "location": ".location, .address, .job-location",
-            "description": ".description, .content, .job-description",
-            "salary": ".salary, .pay, .wage",
-            "deadline": ".deadline, .expiry, .apply-by",
-            "posted_date": ".date, .posted, .published"
-}
+        self.selectors = COMPILED_SELECTORS["mustakbil"]
         
     def get_job_links(self, page: int = 1) -> List[str]:
         """Get job links from a search results page."""
@@ -47,14 +36,14 @@ class MustakbilNepalScraper(BaseScraper):
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Find job links using configured selector
-            job_elements = soup.select(self.selectors['job_links'])
+            job_elements = self.selectors['job_links'].select(soup)
             
             job_links = []
             for element in job_elements:
                 href = element.get('href')
                 if href:
                     # Convert relative URLs to absolute
-                    job_url = urljoin(self.base_url, href)
+                    job_url = self.absolute_url(href)
                     job_links.append(job_url)
             
             self.logger.debug(f"Found {len(job_links)} jobs on page {page}")
@@ -73,34 +62,34 @@ class MustakbilNepalScraper(BaseScraper):
             job_data = {'url': job_url}
             
             # Extract job title
-            title_element = soup.select_one(self.selectors['job_title'])
+            title_element = self.selectors['job_title'].select_one(soup)
             job_data['title'] = title_element.get_text(strip=True) if title_element else ''
             
             # Extract company name
-            company_element = soup.select_one(self.selectors['company'])
+            company_element = self.selectors['company'].select_one(soup)
             job_data['company'] = company_element.get_text(strip=True) if company_element else ''
             
             # Extract location
-            location_element = soup.select_one(self.selectors['location'])
+            location_element = self.selectors['location'].select_one(soup)
             job_data['location'] = location_element.get_text(strip=True) if location_element else ''
             
             # Extract description
-            desc_element = soup.select_one(self.selectors['description'])
+            desc_element = self.selectors['description'].select_one(soup)
             job_data['description'] = desc_element.get_text(strip=True) if desc_element else ''
             
             # Extract salary (if available)
-            salary_element = soup.select_one(self.selectors['salary'])
+            salary_element = self.selectors['salary'].select_one(soup)
             if salary_element:
                 salary_text = salary_element.get_text(strip=True)
                 job_data['salary'] = salary_text
                 # TODO: Parse salary range into min/max values
             
             # Extract deadline
-            deadline_element = soup.select_one(self.selectors['deadline'])
+            deadline_element = self.selectors['deadline'].select_one(soup)
             job_data['deadline'] = deadline_element.get_text(strip=True) if deadline_element else ''
             
             # Extract posted date
-            posted_element = soup.select_one(self.selectors['posted_date'])
+            posted_element = self.selectors['posted_date'].select_one(soup)
             job_data['posted_date'] = posted_element.get_text(strip=True) if posted_element else ''
             
             # TODO: Add more fields as needed
@@ -124,7 +113,7 @@ class MustakbilNepalScraper(BaseScraper):
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Find pagination elements
-            pagination_elements = soup.select(self.selectors['pagination'])
+            pagination_elements = self.selectors['pagination'].select(soup)
             
             if not pagination_elements:
                 return 1
@@ -5,13 +5,21 @@ Provides common functionality like session management, error handling,
 rate limiting, and data validation.
 """
 
+import os
 import time
 import json
+import asyncio
+import threading
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from tenacity import retry, stop_after_attempt, wait_exponential
 import logging
@@ -19,15 +27,67 @@ import logging
 from .logger_config import setup_logger
 from .data_manager import DataManager
 
+# Connections kept open per host by the shared session
+HTTP_POOL_SIZE = 16
+
+# Seconds to wait on a connection or response before giving up on a request
+HTTP_TIMEOUT = 30
+
+# Parsed listing pages are reused for this long (seconds), keeping at most this many
+PAGE_CACHE_TTL = 300
+PAGE_CACHE_SIZE = 4
+
+# Concurrent detail fetching: requests in flight, HTTP/2 connections per host,
+# and requests allowed back-to-back before the politeness rate applies
+DETAIL_CONCURRENCY = 32
+DETAIL_MAX_CONNECTIONS = 4
+DETAIL_BURST = 4
+
+
+class TokenBucket:
+    """Async token bucket releasing `rate` requests per second after a short burst."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class BaseScraper(ABC):
     """Base class for all job website scrapers."""
     
+    # Optional module-level function (content, base_url) -> job links. Sites that
+    # set it, together with listing_url, get their listing pages parsed in parallel
+    job_links_parser: Optional[Callable[[bytes, str], List[str]]] = None
+    
+    # Sites that set this and implement parse_job_details fetch detail pages
+    # concurrently through scrape_all_async
+    concurrent_details: bool = False
+    
+    # Listing pages fetched at once by threads; requests still start at
+    # least `delay` seconds apart
+    listing_workers: int = 1
+    
     def __init__(self, 
                  website_name: str,
                  base_url: str,
                  delay: float = 1.0,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 skip_scraped: bool = True):
         """
         Initialize the base scraper.
         
@@ -36,26 +96,41 @@ class BaseScraper(ABC):
             base_url: Base URL of the website
             delay: Delay between requests in seconds
             max_retries: Maximum number of retries for failed requests
+            skip_scraped: Skip job URLs already saved by an earlier run
         """
         self.website_name = website_name
         self.base_url = base_url
+        parsed_base = urlparse(base_url)
+        self._base_prefix = f"{parsed_base.scheme}://{parsed_base.netloc}"
         self.delay = delay
         self.max_retries = max_retries
+        self.skip_scraped = skip_scraped
         
         # Setup logging
         self.logger = setup_logger(f"scraper_{website_name}")
         
         # Setup session with common headers
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.ua = UserAgent()
         self._update_headers()
         
         # Data manager for storing results
         self.data_manager = DataManager()
         
+        # Recently parsed pages keyed by (url, parser): (fetched_at, soup)
+        self._page_cache: Dict[Tuple[str, str], Tuple[float, BeautifulSoup]] = {}
+        
+        # Earliest start time of the next request, shared by all threads
+        self._request_lock = threading.Lock()
+        self._next_request_at = 0.0
+        
         # Statistics
         self.stats = {
             'jobs_scraped': 0,
+            'jobs_skipped': 0,
             'pages_scraped': 0,
             'errors': 0,
             'start_time': None,
@@ -68,7 +143,8 @@ class BaseScraper(ABC):
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # Every encoding urllib3 can decode here, brotli included when installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
@@ -78,6 +154,15 @@ class BaseScraper(ABC):
         """
         Make a HTTP request with retry logic and rate limiting.
         
+        Plain GETs (no extra arguments besides query params) are
+        conditional: if an earlier response for the same URL and query
+        carried an ETag or Last-Modified, they are sent back and a 304
+        reply is served from the cached body.
+        
+        Requests time out after HTTP_TIMEOUT seconds unless a timeout is
+        given, so a stalled connection is retried instead of holding a
+        pooled connection indefinitely.
+        
         Args:
             url: URL to request
             **kwargs: Additional arguments for requests
@@ -86,13 +171,48 @@ class BaseScraper(ABC):
             Response object
         """
         try:
-            # Rate limiting
-            time.sleep(self.delay)
+            # Rate limiting: request starts are spaced `delay` apart, so time
+            # spent waiting on the previous response counts towards the delay
+            with self._request_lock:
+                now = time.monotonic()
+                wait = self._next_request_at - now
+                self._next_request_at = max(now, self._next_request_at) + self.delay
+            if wait > 0:
+                time.sleep(wait)
+            
+            timeout = kwargs.pop('timeout', HTTP_TIMEOUT)
+            
+            # Cached by the full URL, query included
+            cacheable = set(kwargs) <= {'params'}
+            cache_key = url
+            if cacheable and kwargs.get('params'):
+                cache_key = requests.Request('GET', url, params=kwargs['params']).prepare().url
+            
+            cached = self.data_manager.get_url_meta(cache_key) if cacheable else None
+            headers = {}
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
             
             # Make request
-            response = self.session.get(url, **kwargs)
+            response = self.session.get(url, headers=headers or None, timeout=timeout, **kwargs)
+            
+            if response.status_code == 304 and cached:
+                # Unchanged since the last fetch; callers read the cached body
+                response._content = cached[2]
+                self.logger.debug(f"Not modified, using cached body: {url}")
+                return response
+            
             response.raise_for_status()
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if cacheable and (etag or last_modified):
+                self.data_manager.save_url_meta(cache_key, etag, last_modified, response.content)
+            
             self.logger.debug(f"Successfully fetched: {url}")
             return response
             
@@ -101,6 +221,86 @@ class BaseScraper(ABC):
             self.stats['errors'] += 1
             raise
     
+    def absolute_url(self, href: str) -> str:
+        """
+        Resolve a link against the base URL.
+        
+        Absolute and root-relative hrefs, by far the most common on listing
+        pages, are handled by string checks; anything else goes to urljoin.
+        
+        Args:
+            href: Link as found in the page
+            
+        Returns:
+            Absolute URL
+        """
+        if href.startswith(('https://', 'http://')):
+            return href
+        if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+            return self._base_prefix + href
+        return urljoin(self.base_url, href)
+    
+    def fetch_soup(self, url: str, features: str = 'lxml') -> BeautifulSoup:
+        """
+        Fetch and parse a page, reusing a recent parse of the same URL.
+        
+        Listing pages are often requested by both get_total_pages and
+        get_job_links; the cache saves the second round-trip and parse.
+        The returned tree is shared, so callers must not modify it.
+        
+        Args:
+            url: URL to request
+            features: BeautifulSoup parser to use
+            
+        Returns:
+            Parsed page
+        """
+        key = (url, features)
+        now = time.monotonic()
+        
+        cached = self._page_cache.get(key)
+        if cached and now - cached[0] < PAGE_CACHE_TTL:
+            self.logger.debug(f"Using cached page: {url}")
+            return cached[1]
+        
+        response = self.make_request(url)
+        soup = BeautifulSoup(response.content, features)
+        
+        # Evict the oldest entry once full
+        self._page_cache.pop(key, None)
+        if len(self._page_cache) >= PAGE_CACHE_SIZE:
+            self._page_cache.pop(next(iter(self._page_cache)))
+        self._page_cache[key] = (now, soup)
+        
+        return soup
+    
+    def select_fields(self, soup: BeautifulSoup, selectors: Dict[str, Any],
+                      union_selector: Any) -> Dict[str, Any]:
+        """
+        Find the first element for each field in one walk of the tree.
+        
+        The union selector matches in document order, so the first match
+        per field is what selectors[field].select_one(soup) would return.
+        
+        Args:
+            soup: Parsed page
+            selectors: Field name -> compiled selector
+            union_selector: Compiled union of all patterns in selectors
+        
+        Returns:
+            Field name -> first matching element (missing fields omitted)
+        """
+        elements = {}
+        
+        for element in union_selector.iselect(soup):
+            for field, selector in selectors.items():
+                if field not in elements and selector.match(element):
+                    elements[field] = element
+            if len(elements) == len(selectors):
+                break
+        
+        return elements
+    
     @abstractmethod
     def get_job_links(self, page: int = 1) -> List[str]:
         """
@@ -178,6 +378,85 @@ class BaseScraper(ABC):
         
         return job_data
     
+    def filter_scraped(self, job_links: List[str]) -> List[str]:
+        """
+        Drop job links that were already saved, before any request is made.
+        
+        Args:
+            job_links: Job URLs from a listing page
+            
+        Returns:
+            Job URLs that still need scraping
+        """
+        if not self.skip_scraped:
+            return job_links
+        
+        new_links = [url for url in job_links if not self.data_manager.is_scraped(url)]
+        skipped = len(job_links) - len(new_links)
+        if skipped:
+            self.stats['jobs_skipped'] += skipped
+            self.logger.debug(f"Skipping {skipped} already scraped jobs")
+        
+        return new_links
+    
+    def listing_url(self, page: int) -> str:
+        """
+        Get the URL of a listing page; required when job_links_parser is set.
+        
+        Args:
+            page: Page number
+            
+        Returns:
+            URL of the listing page
+        """
+        raise NotImplementedError
+    
+    def parse_job_details(self, job_url: str, content: bytes) -> Dict[str, Any]:
+        """
+        Build job data from a fetched detail page; required when concurrent_details is set.
+        
+        Args:
+            job_url: URL of the job posting
+            content: Body of the detail response
+        
+        Returns:
+            Dictionary containing job details
+        """
+        raise NotImplementedError
+    
+    def _parse_listing_pages(self, total_pages: int) -> Dict[int, Future]:
+        """
+        Fetch every listing page and parse them in worker processes.
+        
+        Pages are fetched one by one on this thread while already fetched
+        pages are parsed in the pool, so parsing overlaps the network wait
+        and runs on all cores instead of under the GIL.
+        
+        Args:
+            total_pages: Number of listing pages
+            
+        Returns:
+            Page number -> future holding that page's job links
+        """
+        pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, total_pages))
+        parsed_pages = {}
+        
+        try:
+            for page in range(1, total_pages + 1):
+                try:
+                    response = self.make_request(self.listing_url(page))
+                    parsed_pages[page] = pool.submit(self.job_links_parser, response.content, self.base_url)
+                except Exception as e:
+                    # Same outcome as a failed get_job_links: log it and yield no links
+                    self.logger.error(f"Error getting job links from page {page}: {str(e)}")
+                    parsed_pages[page] = Future()
+                    parsed_pages[page].set_result([])
+        finally:
+            # Pending parses still complete; the workers exit once they are done
+            pool.shutdown(wait=False)
+        
+        return parsed_pages
+    
     def scrape_all(self, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Scrape all jobs from the website.
@@ -188,6 +467,9 @@ class BaseScraper(ABC):
         Returns:
             List of job dictionaries
         """
+        if self.concurrent_details:
+            return asyncio.run(self.scrape_all_async(max_pages))
+        
         self.logger.info(f"Starting scrape of {self.website_name}")
         self.stats['start_time'] = datetime.now()
         
@@ -202,36 +484,76 @@ class BaseScraper(ABC):
             self.logger.info(f"Scraping {total_pages} pages")
             
             # Scrape each page
-            for page in range(1, total_pages + 1):
-                self.logger.info(f"Scraping page {page}/{total_pages}")
-                
-                try:
-                    # Get job links from this page
-                    job_links = self.get_job_links(page)
-                    self.stats['pages_scraped'] += 1
+            for page, job_links in self._iter_job_links(total_pages):
+                # Scrape each job
+                for job_url in job_links:
+                    try:
+                        self._accept_job(self.scrape_job_details(job_url), all_jobs)
                     
-                    # Scrape each job
-                    for job_url in job_links:
-                        try:
-                            job_data = self.scrape_job_details(job_url)
-                            
-                            if self.validate_job_data(job_data):
-                                job_data = self.clean_job_data(job_data)
-                                all_jobs.append(job_data)
-                                self.stats['jobs_scraped'] += 1
-                                
-                                # Save job immediately
-                                self.data_manager.save_job(job_data, self.website_name)
-                                
-                        except Exception as e:
-                            self.logger.error(f"Error scraping job {job_url}: {str(e)}")
-                            self.stats['errors'] += 1
-                            continue
+                    except Exception as e:
+                        self.logger.error(f"Error scraping job {job_url}: {str(e)}")
+                        self.stats['errors'] += 1
+                        continue
+        
+        except Exception as e:
+            self.logger.error(f"Fatal error during scraping: {str(e)}")
+            raise
+        
+        finally:
+            self.stats['end_time'] = datetime.now()
+            self._log_stats()
+        
+        return all_jobs
+    
+    async def scrape_all_async(self, max_pages: Optional[int] = None,
+                               concurrency: int = DETAIL_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        Scrape all jobs with overlapping detail-page requests.
+        
+        Listing pages are read as in scrape_all; detail pages are then
+        multiplexed over HTTP/2 and paced by a token bucket refilling one
+        request every `self.delay` seconds.
+        
+        Args:
+            max_pages: Maximum number of pages to scrape (None for all)
+            concurrency: Maximum number of detail pages in flight
+        
+        Returns:
+            List of job dictionaries
+        """
+        self.logger.info(f"Starting scrape of {self.website_name}")
+        self.stats['start_time'] = datetime.now()
+        
+        all_jobs = []
+        
+        try:
+            total_pages = self.get_total_pages()
+            if max_pages:
+                total_pages = min(total_pages, max_pages)
+            
+            self.logger.info(f"Scraping {total_pages} pages")
+            
+            job_links = [job_url for _, page_links in self._iter_job_links(total_pages) for job_url in page_links]
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            rate_limiter = TokenBucket(1 / self.delay, DETAIL_BURST) if self.delay > 0 else None
+            # httpx advertises the encodings it can decode itself
+            headers = {name: value for name, value in self.session.headers.items() if name.lower() != 'accept-encoding'}
+            async with httpx.AsyncClient(headers=headers, http2=True,
+                                         limits=httpx.Limits(max_connections=DETAIL_MAX_CONNECTIONS),
+                                         timeout=HTTP_TIMEOUT, follow_redirects=True) as client:
+                tasks = [self._scrape_job_details_async(client, semaphore, rate_limiter, job_url)
+                         for job_url in job_links]
+                
+                # Handle each job as soon as its page is parsed
+                for task in asyncio.as_completed(tasks):
+                    job_data = await task
+                    try:
+                        self._accept_job(job_data, all_jobs)
                     
-                except Exception as e:
-                    self.logger.error(f"Error scraping page {page}: {str(e)}")
-                    self.stats['errors'] += 1
-                    continue
+                    except Exception as e:
+                        self.logger.error(f"Error scraping job {job_data.get('url')}: {str(e)}")
+                        self.stats['errors'] += 1
         
         except Exception as e:
             self.logger.error(f"Fatal error during scraping: {str(e)}")
@@ -243,6 +565,96 @@ class BaseScraper(ABC):
         
         return all_jobs
     
+    async def _scrape_job_details_async(self, client: httpx.AsyncClient,
+                                        semaphore: asyncio.Semaphore,
+                                        rate_limiter: Optional[TokenBucket],
+                                        job_url: str) -> Dict[str, Any]:
+        """Fetch a posting asynchronously and parse it off the event loop."""
+        try:
+            content = await self._fetch_async(client, semaphore, rate_limiter, job_url)
+        except Exception as e:
+            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
+            return {'url': job_url, 'error': str(e)}
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.parse_job_details, job_url, content)
+    
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    async def _fetch_async(self, client: httpx.AsyncClient,
+                           semaphore: asyncio.Semaphore,
+                           rate_limiter: Optional[TokenBucket], url: str) -> bytes:
+        """Fetch a URL with bounded concurrency, paced by the shared token bucket."""
+        async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.logger.error(f"Request failed for {url}: {str(e)}")
+                self.stats['errors'] += 1
+                raise
+        
+        self.logger.debug(f"Successfully fetched: {url}")
+        return response.content
+    
+    def _iter_job_links(self, total_pages: int) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Read each listing page, yielding the job links still to scrape.
+        
+        Pages that fail are logged and skipped. A link yielded once is not
+        yielded again in the same run, even if it shows up on a later page
+        before its job has been saved.
+        
+        Args:
+            total_pages: Number of listing pages
+        
+        Yields:
+            Tuples of (page number, new job URLs on that page)
+        """
+        parsed_pages = {}
+        if self.job_links_parser is not None and total_pages > 1:
+            parsed_pages = self._parse_listing_pages(total_pages)
+        elif self.listing_workers > 1 and total_pages > 1:
+            # Pages are fetched ahead in threads and still consumed in order
+            pool = ThreadPoolExecutor(max_workers=min(self.listing_workers, total_pages))
+            parsed_pages = {page: pool.submit(self.get_job_links, page) for page in range(1, total_pages + 1)}
+            pool.shutdown(wait=False)
+        
+        seen_links = set()
+        
+        for page in range(1, total_pages + 1):
+            self.logger.info(f"Scraping page {page}/{total_pages}")
+            
+            try:
+                # Get job links from this page
+                job_links = parsed_pages[page].result() if parsed_pages else self.get_job_links(page)
+                self.stats['pages_scraped'] += 1
+            except Exception as e:
+                self.logger.error(f"Error scraping page {page}: {str(e)}")
+                self.stats['errors'] += 1
+                continue
+            
+            new_links = []
+            for job_url in self.filter_scraped(job_links):
+                if job_url not in seen_links:
+                    seen_links.add(job_url)
+                    new_links.append(job_url)
+                else:
+                    self.stats['jobs_skipped'] += 1
+            
+            yield page, new_links
+    
+    def _accept_job(self, job_data: Dict[str, Any], all_jobs: List[Dict[str, Any]]):
+        """Validate, clean and save a scraped job, collecting it in all_jobs."""
+        if self.validate_job_data(job_data):
+            job_data = self.clean_job_data(job_data)
+            all_jobs.append(job_data)
+            self.stats['jobs_scraped'] += 1
+            
+            # Save job immediately
+            self.data_manager.save_job(job_data, self.website_name)
+    
     def _log_stats(self):
         """Log scraping statistics."""
         duration = None
@@ -252,6 +664,7 @@ class BaseScraper(ABC):
         self.logger.info(f"""
         Scraping completed for {self.website_name}:
         - Jobs scraped: {self.stats['jobs_scraped']}
+        - Jobs skipped: {self.stats['jobs_skipped']}
         - Pages scraped: {self.stats['pages_scraped']}
         - Errors: {self.stats['errors']}
         - Duration: {duration}
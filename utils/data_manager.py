@@ -5,15 +5,48 @@ Handles data storage, validation, and export functionality.
 Ensures data safety and provides easy access to scraped information.
 """
 
+import io
+import csv
 import json
+import orjson
+import zlib
+import sqlite3
+import threading
 import pandas as pd
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 import logging
 
 from .logger_config import setup_logger
 
+# Query parameters that only track the visit and never identify a posting
+TRACKING_PARAMS = frozenset(['fbclid', 'gclid'])
+
+
+def _canonical_url(url: str) -> str:
+    """Canonicalize a job URL for duplicate detection."""
+    url = url.strip()
+    if not url:
+        return ''
+    
+    parts = urlsplit(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip('/') or '/'
+    
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+# Write buffer for file exports
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Exports whose raw input is smaller than this are built in memory and written at once
+IN_MEMORY_EXPORT_LIMIT = 2 * 1024 * 1024
+
 
 class DataManager:
     """Manages data storage and retrieval for scraped job data."""
@@ -35,6 +68,127 @@ class DataManager:
             path.mkdir(parents=True, exist_ok=True)
         
         self.logger = setup_logger("data_manager")
+        
+        # Local index database
+        self.index_path = self.base_path / "index.db"
+        # Shared with listing threads for the conditional-GET cache; every
+        # statement and commit goes through the lock, since a commit from one
+        # thread would also commit another thread's open transaction
+        self._index = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._index_lock = threading.Lock()
+        # Job URLs already saved, so later runs can skip fetching them
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS scraped_urls "
+            "(url TEXT PRIMARY KEY, website TEXT, scraped_at TEXT)"
+        )
+        # HTTP validators and compressed bodies for conditional GETs
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS url_meta "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)"
+        )
+        # Per raw file and website job counts and scrape dates, for get_stats
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS file_stats "
+            "(file TEXT, website TEXT, job_count INTEGER, earliest TEXT, latest TEXT)"
+        )
+        self._index.execute("CREATE INDEX IF NOT EXISTS file_stats_file ON file_stats (file)")
+        self._index.commit()
+    
+    def is_scraped(self, url: str) -> bool:
+        """
+        Check whether a job URL has already been saved.
+        
+        Args:
+            url: URL of the job posting
+            
+        Returns:
+            True if the URL was saved by an earlier scrape
+        """
+        with self._index_lock:
+            row = self._index.execute(
+                "SELECT 1 FROM scraped_urls WHERE url = ?", (url,)
+            ).fetchone()
+        return row is not None
+    
+    def mark_scraped(self, url: str, website_name: str):
+        """
+        Record a job URL as saved.
+        
+        Args:
+            url: URL of the job posting
+            website_name: Name of the source website
+        """
+        with self._index_lock:
+            self._index.execute(
+                "INSERT OR IGNORE INTO scraped_urls (url, website, scraped_at) VALUES (?, ?, ?)",
+                (url, website_name, datetime.now().isoformat())
+            )
+            self._index.commit()
+    
+    def get_url_meta(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """
+        Get the cached validators and body of a previously fetched URL.
+        
+        Args:
+            url: Requested URL
+            
+        Returns:
+            Tuple of (ETag, Last-Modified, body), or None if not cached
+        """
+        with self._index_lock:
+            row = self._index.execute(
+                "SELECT etag, last_modified, body FROM url_meta WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        etag, last_modified, body = row
+        return etag, last_modified, zlib.decompress(body)
+    
+    def save_url_meta(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """
+        Cache the validators and body of a fetched URL.
+        
+        Args:
+            url: Requested URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Response body
+        """
+        compressed = zlib.compress(body)
+        with self._index_lock:
+            self._index.execute(
+                "INSERT OR REPLACE INTO url_meta (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, compressed)
+            )
+            self._index.commit()
+    
+    def _index_file(self, filename: str, jobs: List[Dict[str, Any]]):
+        """
+        Record the stats of a raw file, replacing any earlier entry for it.
+        
+        Args:
+            filename: Name of the file in raw storage
+            jobs: Jobs stored in the file
+        """
+        websites = {}
+        for job in jobs:
+            website = job.get('source_website', 'unknown')
+            count, earliest, latest = websites.get(website, (0, None, None))
+            
+            scraped_at = job.get('scraped_at')
+            if scraped_at:
+                earliest = scraped_at if not earliest or scraped_at < earliest else earliest
+                latest = scraped_at if not latest or scraped_at > latest else latest
+            
+            websites[website] = (count + 1, earliest, latest)
+        
+        # Files without jobs still get a row so they count as indexed
+        rows = [(filename, website, *values) for website, values in websites.items()] or [(filename, None, 0, None, None)]
+        with self._index_lock:
+            self._index.execute("DELETE FROM file_stats WHERE file = ?", (filename,))
+            self._index.executemany("INSERT INTO file_stats VALUES (?, ?, ?, ?, ?)", rows)
+            self._index.commit()
     
     def save_job(self, job_data: Dict[str, Any], website_name: str) -> str:
         """
@@ -58,6 +212,10 @@ class DataManager:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(job_data, f, indent=2, ensure_ascii=False)
             
+            if job_data.get('url'):
+                self.mark_scraped(job_data['url'], website_name)
+            self._index_file(filename, [job_data])
+            
             self.logger.debug(f"Saved job to {file_path}")
             return str(file_path)
             
@@ -83,6 +241,7 @@ class DataManager:
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(jobs, f, indent=2, ensure_ascii=False)
+            self._index_file(filename, jobs)
             
             self.logger.info(f"Saved {len(jobs)} jobs to {file_path}")
             return str(file_path)
@@ -91,18 +250,16 @@ class DataManager:
             self.logger.error(f"Error saving batch data: {str(e)}")
             raise
     
-    def load_jobs(self, website_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    def iter_jobs(self, website_name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Load jobs from raw data storage.
+        Iterate over jobs in raw data storage one file at a time.
         
         Args:
             website_name: Filter by website name (None for all)
             
-        Returns:
-            List of job dictionaries
+        Yields:
+            Job dictionaries
         """
-        jobs = []
-        
         # Find all JSON files
         pattern = f"{website_name}_*.json" if website_name else "*.json"
         
@@ -110,16 +267,28 @@ class DataManager:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                
-                # Handle both single jobs and batches
-                if isinstance(data, list):
-                    jobs.extend(data)
-                else:
-                    jobs.append(data)
                     
             except Exception as e:
                 self.logger.error(f"Error loading {file_path}: {str(e)}")
                 continue
+            
+            # Handle both single jobs and batches
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
+    
+    def load_jobs(self, website_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Load jobs from raw data storage.
+        
+        Args:
+            website_name: Filter by website name (None for all)
+            
+        Returns:
+            List of job dictionaries
+        """
+        jobs = list(self.iter_jobs(website_name))
         
         self.logger.info(f"Loaded {len(jobs)} jobs")
         return jobs
@@ -128,85 +297,137 @@ class DataManager:
         """
         Get statistics about stored data.
         
+        Counts come from the file_stats index; only raw files not indexed yet
+        (e.g. written before the index existed) are read.
+        
         Returns:
             Dictionary with data statistics
         """
-        stats = {
-            'total_files': 0,
-            'total_jobs': 0,
-            'websites': {},
-            'date_range': {'earliest': None, 'latest': None}
-        }
-        
-        for file_path in self.raw_path.glob("*.json"):
-            stats['total_files'] += 1
+        on_disk = {file_path.name for file_path in self.raw_path.glob("*.json")}
+        with self._index_lock:
+            indexed = {row[0] for row in self._index.execute("SELECT DISTINCT file FROM file_stats")}
             
+            # Forget deleted files
+            removed = indexed - on_disk
+            if removed:
+                self._index.executemany("DELETE FROM file_stats WHERE file = ?", [(name,) for name in removed])
+                self._index.commit()
+        
+        for name in sorted(on_disk - indexed):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(self.raw_path / name, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
                 # Handle both single jobs and batches
-                if isinstance(data, list):
-                    job_count = len(data)
-                    jobs = data
-                else:
-                    job_count = 1
-                    jobs = [data]
-                
-                stats['total_jobs'] += job_count
+                self._index_file(name, data if isinstance(data, list) else [data])
                 
-                # Extract website info
-                for job in jobs:
-                    website = job.get('source_website', 'unknown')
-                    if website not in stats['websites']:
-                        stats['websites'][website] = 0
-                    stats['websites'][website] += 1
-                    
-                    # Track date range
-                    scraped_at = job.get('scraped_at')
-                    if scraped_at:
-                        if not stats['date_range']['earliest'] or scraped_at < stats['date_range']['earliest']:
-                            stats['date_range']['earliest'] = scraped_at
-                        if not stats['date_range']['latest'] or scraped_at > stats['date_range']['latest']:
-                            stats['date_range']['latest'] = scraped_at
-                            
             except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {str(e)}")
+                self.logger.error(f"Error processing {self.raw_path / name}: {str(e)}")
                 continue
         
+        stats = {
+            'total_files': len(on_disk),
+            'total_jobs': 0,
+            'websites': {},
+            'date_range': {'earliest': None, 'latest': None}
+        }
+        
+        with self._index_lock:
+            rows = self._index.execute(
+                "SELECT website, SUM(job_count), MIN(earliest), MAX(latest) FROM file_stats "
+                "WHERE job_count > 0 GROUP BY website"
+            ).fetchall()
+        for website, job_count, earliest, latest in rows:
+            stats['websites'][website] = job_count
+            stats['total_jobs'] += job_count
+            
+            # Track date range
+            if earliest and (not stats['date_range']['earliest'] or earliest < stats['date_range']['earliest']):
+                stats['date_range']['earliest'] = earliest
+            if latest and (not stats['date_range']['latest'] or latest > stats['date_range']['latest']):
+                stats['date_range']['latest'] = latest
+        
         return stats
     
+    def estimate_size(self, website_name: Optional[str] = None) -> int:
+        """
+        Estimate the size of an export from the raw files it would read.
+        
+        Args:
+            website_name: Filter by website name (None for all)
+            
+        Returns:
+            Total size of the matching raw files in bytes
+        """
+        pattern = f"{website_name}_*.json" if website_name else "*.json"
+        return sum(file_path.stat().st_size for file_path in self.raw_path.glob(pattern))
+    
+    def _export_file_path(self, website_name: Optional[str], filename: Optional[str],
+                          extension: str) -> Path:
+        """Resolve the export path, generating a filename if not provided."""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            website_part = f"{website_name}_" if website_name else "all_"
+            filename = f"{website_part}jobs_{timestamp}.{extension}"
+        
+        return self.exports_path / filename
+    
     def export_to_csv(self, website_name: Optional[str] = None, 
-                      filename: Optional[str] = None) -> str:
+                      filename: Optional[str] = None,
+                      batch_size: int = 5000,
+                      streaming: Optional[bool] = None) -> str:
         """
         Export jobs to CSV format.
         
+        Small exports are built in memory and written at once; large ones
+        are streamed in batches.
+        
         Args:
             website_name: Filter by website name (None for all)
             filename: Output filename (auto-generated if None)
+            batch_size: Number of rows written per batch when streaming
+            streaming: Force streaming on or off (None to decide by size)
             
         Returns:
             Path to exported CSV file
         """
-        jobs = self.load_jobs(website_name)
+        if streaming is None:
+            streaming = self.estimate_size(website_name) >= IN_MEMORY_EXPORT_LIMIT
         
-        if not jobs:
-            raise ValueError("No jobs found to export")
+        # Small exports are loaded once; large ones are re-read for each pass
+        jobs = None if streaming else self.load_jobs(website_name)
         
-        # Create DataFrame
-        df = pd.DataFrame(jobs)
+        # First pass collects the header: the union of fields in first-seen order
+        fieldnames = {}
+        job_count = 0
+        for job in (self.iter_jobs(website_name) if streaming else jobs):
+            fieldnames.update(dict.fromkeys(job))
+            job_count += 1
         
-        # Generate filename if not provided
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            website_part = f"{website_name}_" if website_name else "all_"
-            filename = f"{website_part}jobs_{timestamp}.csv"
+        if not job_count:
+            raise ValueError("No jobs found to export")
         
-        file_path = self.exports_path / filename
+        file_path = self._export_file_path(website_name, filename, 'csv')
         
         try:
-            df.to_csv(file_path, index=False, encoding='utf-8')
-            self.logger.info(f"Exported {len(jobs)} jobs to {file_path}")
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+                out = f if streaming else io.StringIO(newline='')
+                writer = csv.DictWriter(out, fieldnames=list(fieldnames))
+                writer.writeheader()
+                
+                if streaming:
+                    batch = []
+                    for job in self.iter_jobs(website_name):
+                        batch.append(job)
+                        if len(batch) >= batch_size:
+                            writer.writerows(batch)
+                            batch.clear()
+                    writer.writerows(batch)
+                else:
+                    writer.writerows(jobs)
+                    f.write(out.getvalue())
+            
+            self.logger.info(f"Exported {job_count} jobs to {file_path}")
             return str(file_path)
             
         except Exception as e:
@@ -214,35 +435,60 @@ class DataManager:
             raise
     
     def export_to_json(self, website_name: Optional[str] = None,
-                       filename: Optional[str] = None) -> str:
+                       filename: Optional[str] = None,
+                       batch_size: int = 5000,
+                       streaming: Optional[bool] = None) -> str:
         """
         Export jobs to JSON format.
         
+        Small exports are serialized in memory and written at once; large
+        ones are streamed in batches.
+        
         Args:
             website_name: Filter by website name (None for all)
             filename: Output filename (auto-generated if None)
+            batch_size: Number of records written per batch when streaming
+            streaming: Force streaming on or off (None to decide by size)
             
         Returns:
             Path to exported JSON file
         """
-        jobs = self.load_jobs(website_name)
+        if streaming is None:
+            streaming = self.estimate_size(website_name) >= IN_MEMORY_EXPORT_LIMIT
         
-        if not jobs:
-            raise ValueError("No jobs found to export")
+        jobs = self.iter_jobs(website_name) if streaming else iter(self.load_jobs(website_name))
+        first_job = next(jobs, None)
         
-        # Generate filename if not provided
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            website_part = f"{website_name}_" if website_name else "all_"
-            filename = f"{website_part}jobs_{timestamp}.json"
+        if first_job is None:
+            raise ValueError("No jobs found to export")
         
-        file_path = self.exports_path / filename
+        file_path = self._export_file_path(website_name, filename, 'json')
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, indent=2, ensure_ascii=False)
+            job_count = 1
+            with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                if not streaming:
+                    all_jobs = [first_job, *jobs]
+                    job_count = len(all_jobs)
+                    f.write(orjson.dumps(all_jobs, option=orjson.OPT_INDENT_2))
+                else:
+                    # Same layout as the in-memory dump, one array element at a time
+                    f.write(b'[\n')
+                    batch = [orjson.dumps([first_job], option=orjson.OPT_INDENT_2)[2:-2]]
+                    separator = b''
+                    for job in jobs:
+                        batch.append(orjson.dumps([job], option=orjson.OPT_INDENT_2)[2:-2])
+                        job_count += 1
+                        if len(batch) >= batch_size:
+                            f.write(separator + b',\n'.join(batch))
+                            separator = b',\n'
+                            batch.clear()
+                    
+                    if batch:
+                        f.write(separator + b',\n'.join(batch))
+                    f.write(b'\n]')
             
-            self.logger.info(f"Exported {len(jobs)} jobs to {file_path}")
+            self.logger.info(f"Exported {job_count} jobs to {file_path}")
             return str(file_path)
             
         except Exception as e:
@@ -251,7 +497,12 @@ class DataManager:
     
     def clean_duplicates(self) -> int:
         """
-        Remove duplicate jobs based on title, company, and URL.
+        Remove duplicate jobs in two linear passes.
+        
+        Jobs are first deduplicated on their canonical URL (tracking
+        parameters, fragment and trailing slash removed), then on their title
+        and company with case, punctuation and spacing normalized. The second
+        pass only considers jobs where both title and company are present.
         
         Returns:
             Number of duplicates removed
@@ -264,16 +515,32 @@ class DataManager:
         # Create DataFrame for duplicate detection
         df = pd.DataFrame(jobs)
         
-        # Remove duplicates based on key fields
-        duplicate_cols = ['title', 'company', 'url']
-        available_cols = [col for col in duplicate_cols if col in df.columns]
-        
-        if not available_cols:
+        has_text = 'title' in df.columns and 'company' in df.columns
+        if 'url' not in df.columns and not has_text:
             self.logger.warning("No suitable columns for duplicate detection")
             return 0
         
         initial_count = len(df)
-        df_clean = df.drop_duplicates(subset=available_cols, keep='first')
+        
+        # Stage 1: same posting under different tracking parameters or URL spellings
+        if 'url' in df.columns:
+            url_key = df['url'].fillna('').astype(str).map(_canonical_url)
+            df = df[~(url_key.duplicated() & (url_key != ''))]
+        
+        # Stage 2: same title and company with cosmetic differences; a title
+        # alone is too generic to merge postings on
+        if has_text:
+            title_key, company_key = (
+                df[col].fillna('').astype(str).str.lower()
+                .str.replace(r'[^\w\s]', ' ', regex=True)
+                .str.split().str.join(' ')
+                for col in ('title', 'company')
+            )
+            complete = (title_key != '') & (company_key != '')
+            text_key = (title_key + '|' + company_key)[complete]
+            df = df[~(text_key.duplicated().reindex(df.index, fill_value=False))]
+        
+        df_clean = df
         duplicates_removed = initial_count - len(df_clean)
         
         if duplicates_removed > 0:
@@ -284,4 +551,4 @@ class DataManager:
             df_clean.to_json(cleaned_file, orient='records', indent=2)
             self.logger.info(f"Removed {duplicates_removed} duplicates, saved to {cleaned_file}")
         
-        return duplicates_removed 
\ No newline at end of file
+        return duplicates_removed